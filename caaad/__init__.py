@@ -0,0 +1,53 @@
+"""
+Algorithms for the laboratory exercises of Computer Aided Analysis and Design: dense, sparse and batched matrices
+(lab 1), points and direct search methods (lab 2), gradient methods (lab 3) and constrained optimization (lab 4).
+Submodules are imported on first use of one of their names, so e.g. importing the direct search methods does not
+import the linear algebra, and NumPy is only imported when the NumPy backend is selected.
+"""
+import importlib
+
+_exports = {
+    'Matrix': 'matrix',
+    'LUFactorization': 'matrix',
+    'CSRMatrix': 'sparse_matrix',
+    'BatchedMatrix': 'batched_matrix',
+    'Expression': 'expression',
+    'get_backend': 'backends',
+    'set_default_backend': 'backends',
+    'set_parallel': 'backends',
+    'set_strassen': 'backends',
+    'Point': 'point',
+    'find_unimodal_interval': 'lab2_utils',
+    'golden_section_search': 'lab2_utils',
+    'brent_search': 'lab2_utils',
+    'coordinate_search': 'lab2_utils',
+    'hooke_jeeves': 'lab2_utils',
+    'nelder_mead': 'lab2_utils',
+    'gradient_descent': 'lab3_utils',
+    'newton_raphson': 'lab3_utils',
+    'gauss_newton': 'lab3_utils',
+    'box_method': 'lab4_utils',
+    'transformation_method': 'lab4_utils',
+}
+_submodules = {'backends', 'batched_matrix', 'expression', 'lab2_utils', 'lab3_utils', 'lab4_utils', 'matrix', 'point', 'sparse_matrix'}
+
+__all__ = list(_exports)
+
+def __getattr__(name):
+    """
+    Imports the submodule that defines a name on first access (module __getattr__, PEP 562). The value is stored
+    in the package namespace, so later accesses are plain attribute lookups.
+    Input: name (str - exported name or submodule name).
+    Output: The exported object or submodule.
+    """
+    if name in _exports:
+        value = getattr(importlib.import_module(f".{_exports[name]}", __name__), name)
+    elif name in _submodules:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports) | _submodules)
@@ -0,0 +1,991 @@
+from abc import ABC, abstractmethod
+from array import array
+import mmap
+from operator import add, sub, mul
+import os
+import sys
+import warnings
+
+from .expression import Expression
+
+np = None # NumPy is optional and imported by the first use of the NumPy backend (see _load_numpy)
+
+# matmul dispatch thresholds of the pure Python backend (see benchmark.py for how they were chosen)
+MATMUL_SMALL_SIZE = 3 # all dimensions up to this use the direct kernel (Hessians, Jacobians)
+MATMUL_BLOCKED_SIZE = 160 # from this size on the tiled kernel is used
+MATMUL_TILE_SIZE = 64 # rows and columns per tile in the tiled kernel
+SOLVE_BLOCK_SIZE = 64 # right-hand side columns substituted together in one pass
+LU_BLOCKED_SIZE = 64 # from this size on LU/LUP use the blocked right-looking algorithm
+LU_BLOCK_SIZE = 32 # columns per panel in the blocked LU
+PARALLEL_MIN_SIZE = 128 # parallel mode: matmul from n*k*m >= size**3, elementwise operations from n*m >= size**2 on
+STRASSEN_LEAF_SIZE = 256 # Strassen mode: blocks up to this size are multiplied with the classic kernels
+
+def _modification_bounds(gamma, xi, n, epsilon):
+    """
+    Bounds of the modified Cholesky factorization (Gill, Murray and Wright): the pivots of D are raised to at least delta,
+    and far enough that no element of L times the square root of its pivot exceeds the square root of beta2.
+    Input: gamma (float - largest absolute diagonal element), xi (float - largest absolute off-diagonal element),
+           n (int), epsilon (float - tolerance for zero).
+    Output: beta2 (float), delta (float).
+    """
+    beta2 = max(gamma, xi / (n * n - 1)**0.5 if n > 1 else 0., sys.float_info.epsilon)
+    delta = max(epsilon, sys.float_info.epsilon * (gamma + xi))
+    return beta2, delta
+
+def _matmul_small(a, b, n, k, m):
+    """
+    Multiplies tiny dense row-major matrices with closed-form dot products (no packing overhead).
+    Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions).
+    Output: array('d') - n x m product.
+    """
+    if k == 1:
+        return array('d', [a[i] * b[j] for i in range(n) for j in range(m)])
+    if k == 2:
+        return array('d', [a[2 * i] * b[j] + a[2 * i + 1] * b[m + j] for i in range(n) for j in range(m)])
+    if k == 3:
+        return array('d', [a[3 * i] * b[j] + a[3 * i + 1] * b[m + j] + a[3 * i + 2] * b[2 * m + j]
+                           for i in range(n) for j in range(m)])
+    return array('d', [sum([a[i * k + p] * b[p * m + j] for p in range(k)]) for i in range(n) for j in range(m)])
+
+def _pack_columns(b, k, m):
+    """
+    Packs the columns of a dense row-major matrix into lists, so they can be walked contiguously.
+    Input: b (array('d') - k x m), k, m (int - dimensions).
+    Output: list of m lists of k floats.
+    """
+    if m == 1:
+        return [b.tolist()]
+    return [b[j::m].tolist() for j in range(m)]
+
+def _matmul_packed(a, b, n, k, m, columns=None):
+    """
+    Multiplies dense row-major matrices by packing the columns of b once and computing whole output rows.
+    Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions),
+           columns (list of m lists of k floats - the already packed columns of b, optional).
+    Output: array('d') - n x m product.
+    """
+    columns = columns or _pack_columns(b, k, m)
+    result = array('d')
+    for i in range(n):
+        row = a[i * k:(i + 1) * k].tolist()
+        result.extend([sum(map(mul, row, column)) for column in columns])
+    return result
+
+def _matmul_blocked(a, b, n, k, m, tile=None, columns=None):
+    """
+    Multiplies dense row-major matrices tile by tile, so a block of rows of a and a block of packed columns of b
+    stay hot while they are reused.
+    Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions), tile (int - tile size, optional),
+           columns (list of m lists of k floats - the already packed columns of b, optional).
+    Output: array('d') - n x m product.
+    """
+    tile = tile or MATMUL_TILE_SIZE
+    columns = columns or _pack_columns(b, k, m)
+    result = array('d')
+    for i0 in range(0, n, tile):
+        rows = [a[i * k:(i + 1) * k].tolist() for i in range(i0, min(i0 + tile, n))]
+        block = [[0.0] * m for _ in rows]
+        for j0 in range(0, m, tile):
+            column_tile = columns[j0:j0 + tile]
+            for out_row, row in zip(block, rows):
+                out_row[j0:j0 + tile] = [sum(map(mul, row, column)) for column in column_tile]
+        for out_row in block:
+            result.extend(out_row)
+    return result
+
+def _matmul_serial(a, b, n, k, m):
+    """
+    Picks the single process matrix multiplication kernel based on operand sizes.
+    Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions).
+    Output: array('d') - n x m product.
+    """
+    if max(n, k, m) <= MATMUL_SMALL_SIZE:
+        return _matmul_small(a, b, n, k, m)
+    if max(n, m) >= MATMUL_BLOCKED_SIZE:
+        return _matmul_blocked(a, b, n, k, m)
+    return _matmul_packed(a, b, n, k, m)
+
+def _quadrants(a, n):
+    """
+    Splits a dense row-major n x n matrix (n even) into its four n/2 x n/2 blocks.
+    Input: a (array - n x n), n (int).
+    Output: A11, A12, A21, A22 (arrays - n/2 x n/2).
+    """
+    h = n // 2
+    blocks = [array(a.typecode) for _ in range(4)]
+    for i in range(n):
+        top = 0 if i < h else 2
+        blocks[top].extend(a[i * n:i * n + h])
+        blocks[top + 1].extend(a[i * n + h:(i + 1) * n])
+    return blocks
+
+def _join(c11, c12, c21, c22, h):
+    """
+    Assembles a dense row-major 2h x 2h matrix from its four h x h blocks.
+    Input: c11, c12, c21, c22 (arrays - h x h), h (int).
+    Output: array('d') - 2h x 2h.
+    """
+    result = array('d')
+    for top, bottom in ((c11, c12), (c21, c22)):
+        for i in range(h):
+            result.extend(top[i * h:(i + 1) * h])
+            result.extend(bottom[i * h:(i + 1) * h])
+    return result
+
+def _pad(a, n, size):
+    """
+    Pads a dense row-major n x n matrix with zero rows and columns to size x size.
+    Input: a (array - n x n), n (int), size (int - new size, >= n).
+    Output: array - size x size.
+    """
+    result = array(a.typecode)
+    zeros = array(a.typecode, bytes(a.itemsize * (size - n)))
+    for i in range(n):
+        result.extend(a[i * n:(i + 1) * n])
+        result.extend(zeros)
+    result.extend(array(a.typecode, bytes(a.itemsize * size * (size - n))))
+    return result
+
+def _crop(a, size, n):
+    """
+    Keeps the leading n x n block of a dense row-major size x size matrix.
+    Input: a (array - size x size), size (int), n (int).
+    Output: array - n x n.
+    """
+    result = array(a.typecode)
+    for i in range(n):
+        result.extend(a[i * size:i * size + n])
+    return result
+
+def _matmul_strassen(a, b, n, leaf=None):
+    """
+    Strassen-Winograd multiplication of square matrices: 7 half-size products and 15 block additions per level
+    instead of 8 products, so about n^2.81 instead of n^3 operations. Blocks up to the leaf size use the classic
+    kernels; an odd size is padded with one zero row and column on its level.
+    The error bound grows with the recursion depth (roughly by a factor of 6-12 per level, normwise instead of
+    elementwise), see benchmark_strassen in benchmark.py.
+    Input: a (array('d') - n x n), b (array('d') - n x n), n (int), leaf (int - leaf block size, optional).
+    Output: array('d') - n x n product.
+    """
+    leaf = leaf or _strassen_leaf_size
+    if n <= leaf:
+        return _matmul_serial(a, b, n, n, n)
+    size = n + n % 2
+    if size != n:
+        a, b = _pad(a, n, size), _pad(b, n, size)
+    h = size // 2
+    a11, a12, a21, a22 = _quadrants(a, size)
+    b11, b12, b21, b22 = _quadrants(b, size)
+    plus = lambda x, y: array('d', map(add, x, y))
+    minus = lambda x, y: array('d', map(sub, x, y))
+    s1 = plus(a21, a22)
+    s2 = minus(s1, a11)
+    s3 = minus(a11, a21)
+    s4 = minus(a12, s2)
+    t1 = minus(b12, b11)
+    t2 = minus(b22, t1)
+    t3 = minus(b22, b12)
+    t4 = minus(t2, b21)
+    p1 = _matmul_strassen(a11, b11, h, leaf)
+    p2 = _matmul_strassen(a12, b21, h, leaf)
+    p3 = _matmul_strassen(s4, b22, h, leaf)
+    p4 = _matmul_strassen(a22, t4, h, leaf)
+    p5 = _matmul_strassen(s1, t1, h, leaf)
+    p6 = _matmul_strassen(s2, t2, h, leaf)
+    p7 = _matmul_strassen(s3, t3, h, leaf)
+    u2 = plus(p1, p6)
+    u3 = plus(u2, p7)
+    u4 = plus(u2, p5)
+    result = _join(plus(p1, p2), plus(u4, p3), minus(u3, p4), plus(u3, p5), h)
+    return result if size == n else _crop(result, size, n)
+
+def _share(buffer):
+    """
+    Copies a buffer into a new shared memory block, which worker processes attach to by name instead of unpickling a copy.
+    Input: buffer (array('d')).
+    Output: SharedMemory (the caller closes and unlinks it).
+    """
+    from multiprocessing import shared_memory # only the parallel mode needs it, workers start without it
+    block = shared_memory.SharedMemory(create=True, size=max(8 * len(buffer), 1))
+    block.buf[:8 * len(buffer)] = memoryview(buffer).cast('B')
+    return block
+
+def _read_shared(name, start, end):
+    """
+    Reads elements start..end of a shared memory block (run in the worker processes).
+    Input: name (str - shared memory name), start, end (int - element range).
+    Output: array('d').
+    """
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    values = array('d')
+    values.frombytes(block.buf[8 * start:8 * end])
+    block.close()
+    return values
+
+def _write_shared(name, start, values):
+    """
+    Writes elements into a shared memory block from position start on (run in the worker processes).
+    Input: name (str - shared memory name), start (int), values (array('d')).
+    Output: None.
+    """
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    block.buf[8 * start:8 * (start + len(values))] = memoryview(values).cast('B')
+    block.close()
+
+def _matmul_rows_task(a_name, b_name, out_name, r0, r1, k, m):
+    """
+    Worker task of the parallel matmul: multiplies rows r0..r1 of a by b, writing them into the shared result.
+    Input: a_name, b_name, out_name (str - shared memory names), r0, r1 (int - row range), k, m (int - dimensions).
+    Output: None.
+    """
+    a = _read_shared(a_name, r0 * k, r1 * k)
+    b = _read_shared(b_name, 0, k * m)
+    _write_shared(out_name, r0 * m, _matmul_serial(a, b, r1 - r0, k, m))
+
+def _elementwise_task(a_name, b_name, out_name, start, end, operation):
+    """
+    Worker task of the parallel elementwise operations: applies operation to elements start..end.
+    Input: a_name, b_name, out_name (str - shared memory names), start, end (int), operation (callable - add or sub).
+    Output: None.
+    """
+    a, b = _read_shared(a_name, start, end), _read_shared(b_name, start, end)
+    _write_shared(out_name, start, array('d', map(operation, a, b)))
+
+def _run_parallel(task, operands, size, chunks, *args):
+    """
+    Shares the operands, runs one task per chunk on the process pool and collects the shared result.
+    Input: task (callable - worker task), operands (list of array('d')), size (int - result length),
+           chunks (list of (int, int) - ranges handed to the tasks), args (extra task arguments).
+    Output: array('d') - the result.
+    """
+    from multiprocessing import shared_memory
+    blocks = [_share(operand) for operand in operands] + [shared_memory.SharedMemory(create=True, size=max(8 * size, 1))]
+    try:
+        names = [block.name for block in blocks]
+        futures = [_get_pool().submit(task, *names, start, end, *args) for start, end in chunks]
+        for future in futures:
+            future.result()
+        result = array('d')
+        result.frombytes(blocks[-1].buf[:8 * size])
+        return result
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+def _split(n, parts):
+    """
+    Splits range(n) into at most parts contiguous, nearly equal ranges.
+    Input: n (int), parts (int).
+    Output: list of (int, int).
+    """
+    parts = max(1, min(parts, n))
+    bounds = [n * p // parts for p in range(parts + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+def _get_pool():
+    """
+    Returns the process pool of the parallel mode, starting it on first use.
+    Input: None.
+    Output: ProcessPoolExecutor.
+    """
+    global _pool
+    if _pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        _pool = ProcessPoolExecutor(max_workers=_workers)
+    return _pool
+
+class AbstractBackend(ABC):
+    """
+    Storage and numerical kernels behind a Matrix. Buffers are flat and row-major; n x n factorizations are done in place.
+    """
+    name = None
+    fuses_expressions = False # True if evaluate() runs a whole expression as one loop
+
+    @abstractmethod
+    def zeros(self, size):
+        pass
+
+    @abstractmethod
+    def from_values(self, values):
+        pass
+
+    @abstractmethod
+    def coerce(self, buffer):
+        pass
+
+    @abstractmethod
+    def pack(self, data, rows, cols, row_stride, col_stride):
+        pass
+
+    @abstractmethod
+    def load_binary(self, file_name, offset, size, dtype):
+        pass
+
+    @abstractmethod
+    def write_binary(self, f, buffer, dtype):
+        pass
+
+    @abstractmethod
+    def extend(self, buffer, values):
+        pass
+
+    @abstractmethod
+    def single(self, buffer):
+        pass
+
+    @abstractmethod
+    def scale_rows(self, a, scales, m):
+        pass
+
+    @abstractmethod
+    def equal(self, a, b):
+        pass
+
+    @abstractmethod
+    def add(self, a, b):
+        pass
+
+    @abstractmethod
+    def sub(self, a, b):
+        pass
+
+    @abstractmethod
+    def scale(self, a, scalar):
+        pass
+
+    @abstractmethod
+    def divide(self, a, scalar):
+        pass
+
+    @abstractmethod
+    def evaluate(self, expression, out=None):
+        pass
+
+    @abstractmethod
+    def matmul(self, a, b, n, k, m):
+        pass
+
+    @abstractmethod
+    def matmul_transposed(self, a, bt, n, k, m):
+        pass
+
+    @abstractmethod
+    def normal_equations(self, j, r, n, k, m):
+        pass
+
+    @abstractmethod
+    def lu(self, a, n, epsilon):
+        pass
+
+    @abstractmethod
+    def lup(self, a, n, epsilon):
+        pass
+
+    @abstractmethod
+    def ldl(self, a, n, epsilon, modified):
+        pass
+
+    @abstractmethod
+    def permute_rows(self, b, permutation, m):
+        pass
+
+    @abstractmethod
+    def forward_substitution(self, lu, y, n, m):
+        pass
+
+    @abstractmethod
+    def backward_substitution(self, lu, y, n, m, epsilon):
+        pass
+
+    def copy(self, buffer):
+        return self.from_values(buffer)
+
+class PythonBackend(AbstractBackend):
+    """
+    Pure Python kernels working on array('d') buffers.
+    """
+    name = 'python'
+    fuses_expressions = True
+
+    def zeros(self, size):
+        return array('d', bytes(8 * size))
+
+    def from_values(self, values):
+        return array('d', values)
+
+    def coerce(self, buffer):
+        return buffer if isinstance(buffer, array) else array('d', buffer)
+
+    def pack(self, data, rows, cols, row_stride, col_stride):
+        """
+        Copies a strided matrix into a dense row-major buffer, one strided slice per row.
+        Input: data (array('d')), rows, cols (int - dimensions), row_stride, col_stride (int - element strides).
+        Output: array('d') - rows x cols.
+        """
+        result = array('d')
+        if cols:
+            for i in range(rows):
+                start = i * row_stride
+                result.extend(data[start:start + (cols - 1) * col_stride + 1:col_stride])
+        return result
+
+    def load_binary(self, file_name, offset, size, dtype):
+        """
+        Reads raw little-endian floats from a file through a read-only memory map (one copy, no parsing).
+        Input: file_name (str), offset (int - bytes before the data), size (int - number of elements), dtype (str - 'f8' or 'f4').
+        Output: array('d') of length size.
+        """
+        buffer = array('d' if dtype == 'f8' else 'f')
+        if size:
+            with open(file_name, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    buffer.frombytes(view[offset:offset + size * buffer.itemsize])
+        if sys.byteorder == 'big':
+            buffer.byteswap()
+        return buffer if dtype == 'f8' else array('d', buffer)
+
+    def write_binary(self, f, buffer, dtype):
+        """
+        Writes the elements as raw little-endian floats.
+        Input: f (binary file object), buffer (array('d')), dtype (str - 'f8' or 'f4').
+        Output: None.
+        """
+        if dtype == 'f4':
+            buffer = array('f', buffer)
+        if sys.byteorder == 'big':
+            buffer = array(buffer.typecode, buffer)
+            buffer.byteswap()
+        buffer.tofile(f)
+
+    def extend(self, buffer, values):
+        buffer.extend(values)
+        return buffer
+
+    def single(self, buffer):
+        """
+        Single precision copy of a buffer (half the memory of the float64 original).
+        Input: buffer (array('d')).
+        Output: array('f').
+        """
+        return array('f', buffer)
+
+    def scale_rows(self, a, scales, m):
+        """
+        Multiplies every row of a buffer by its own factor.
+        Input: a (array('d') - n x m), scales (list of floats - length n), m (int - number of columns).
+        Output: array('d') - n x m scaled copy.
+        """
+        return array('d', [x * scales[k // m] for k, x in enumerate(a)])
+
+    def equal(self, a, b):
+        return a == self.coerce(b)
+
+    def add(self, a, b):
+        if _workers > 1 and len(a) >= _parallel_min_size**2:
+            return _run_parallel(_elementwise_task, [a, self.coerce(b)], len(a), _split(len(a), _workers), add)
+        return array('d', map(add, a, b))
+
+    def sub(self, a, b):
+        if _workers > 1 and len(a) >= _parallel_min_size**2:
+            return _run_parallel(_elementwise_task, [a, self.coerce(b)], len(a), _split(len(a), _workers), sub)
+        return array('d', map(sub, a, b))
+
+    def scale(self, a, scalar):
+        return array('d', [x * scalar for x in a])
+
+    def divide(self, a, scalar):
+        return array('d', [x / scalar for x in a])
+
+    def evaluate(self, expression, out=None):
+        """
+        Evaluates a lazy elementwise expression with one fused loop, which writes every element straight into out
+        if it is given. In parallel mode a plain sum or difference of two large buffers is still split over the
+        worker processes (their result is copied into out).
+        Input: expression (Expression), out (array('d') - buffer the result is written into, optional).
+        Output: array('d') - the result (out, if given).
+        """
+        left, right = expression.left, expression.right
+        if _workers > 1 and expression.op in ('+', '-') and not isinstance(left, Expression) \
+                and not isinstance(right, Expression) and hasattr(left, '__len__') and hasattr(right, '__len__') \
+                and len(left) >= _parallel_min_size**2:
+            result = self.add(left, right) if expression.op == '+' else self.sub(left, right)
+            if out is None:
+                return result
+            out[:] = result
+            return out
+        if out is None:
+            return array('d', expression.evaluate())
+        return expression.evaluate(out)
+
+    def matmul(self, a, b, n, k, m):
+        """
+        Picks the matrix multiplication kernel based on operand sizes. In parallel mode (set_parallel) large products
+        are split into row blocks that the worker processes multiply at the same time; in Strassen mode (set_strassen)
+        large square products use the Strassen-Winograd recursion.
+        Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions).
+        Output: array('d') - n x m product.
+        """
+        if _workers > 1 and n > 1 and n * k * m >= _parallel_min_size**3:
+            a, b = array('d', a) if a.typecode != 'd' else a, array('d', b) if b.typecode != 'd' else b
+            return _run_parallel(_matmul_rows_task, [a, b], n * m, _split(n, _workers), k, m)
+        if _strassen_min_size is not None and n == k == m and n >= _strassen_min_size:
+            return _matmul_strassen(a, b, n)
+        return _matmul_serial(a, b, n, k, m)
+
+    def matmul_transposed(self, a, bt, n, k, m):
+        """
+        Computes a @ b for b given as its transpose (a transpose view): the rows of bt are the columns of b,
+        so the packed kernel uses them directly.
+        Input: a (array('d') - n x k), bt (array('d') - m x k, the transpose of b), n, k, m (int - dimensions).
+        Output: array('d') - n x m product.
+        """
+        if max(n, k, m) <= MATMUL_SMALL_SIZE or (_workers > 1 and n * k * m >= _parallel_min_size**3):
+            return self.matmul(a, self.pack(bt, k, m, 1, k), n, k, m)
+        columns = [bt[j * k:(j + 1) * k].tolist() for j in range(m)]
+        if max(n, m) >= MATMUL_BLOCKED_SIZE:
+            return _matmul_blocked(a, None, n, k, m, columns=columns)
+        return _matmul_packed(a, None, n, k, m, columns)
+
+    def normal_equations(self, j, r, n, k, m):
+        """
+        Computes J^T J and J^T r in one kernel: the columns of J are read once (strided slices) and every entry is a
+        dot product of two columns. Only the upper half of the symmetric J^T J is computed, the lower half is mirrored.
+        Input: j (array('d') - n x k), r (array('d') - n x m), n, k, m (int - dimensions).
+        Output: array('d') - k x k (J^T J), array('d') - k x m (J^T r).
+        """
+        columns = _pack_columns(j, n, k)
+        r_columns = _pack_columns(r, n, m)
+        gram = [0.] * (k * k)
+        for p, column in enumerate(columns):
+            for q in range(p, k):
+                gram[p * k + q] = gram[q * k + p] = sum(map(mul, column, columns[q]))
+        rhs = [sum(map(mul, column, r_column)) for column in columns for r_column in r_columns]
+        return array('d', gram), array('d', rhs)
+
+    def lu(self, a, n, epsilon):
+        """
+        LU decomposition without pivoting.
+        Input: a (array('d') - n x n, overwritten with L and U), n (int), epsilon (float - tolerance for zero).
+        Output: None.
+        """
+        self._lu_blocked(a, n, epsilon, None)
+
+    def lup(self, a, n, epsilon):
+        """
+        LU decomposition with partial pivoting: for every column the row with the largest absolute value
+        (argmax) is swapped into the pivot position once.
+        Input: a (array('d') - n x n, overwritten with L and U), n (int), epsilon (float - tolerance for zero).
+        Output: Permutation vector (list of ints - row i of PA is row permutation[i] of A), number of row switches (int).
+        """
+        permutation = list(range(n))
+        num_switches = self._lu_blocked(a, n, epsilon, permutation)
+        return permutation, num_switches
+
+    def _factor_panel(self, a, n, k0, k1, epsilon, permutation):
+        """
+        Classic elimination restricted to the panel of columns k0..k1 (rows k0..n). Pivot rows are swapped in full.
+        Input: a (array('d') - n x n), n (int), k0, k1 (int - panel columns), epsilon (float - tolerance for zero),
+               permutation (list of ints, updated in place - or None for LU without pivoting).
+        Output: Number of row switches (int).
+        """
+        num_switches = 0
+        for i in range(k0, min(k1, n-1)):
+            if permutation is not None:
+                p = max(range(i, n), key=lambda j: abs(a[j * n + i])) # pick pivot
+                if p != i:
+                    num_switches += 1
+                    permutation[i], permutation[p] = permutation[p], permutation[i]
+                    a[i * n:(i + 1) * n], a[p * n:(p + 1) * n] = a[p * n:(p + 1) * n], a[i * n:(i + 1) * n]
+                pivot = a[i * n + i]
+                if pivot == 0: # the whole column is zero, backward substitution will report the singular matrix
+                    continue
+            else:
+                pivot = a[i * n + i]
+                if abs(pivot) < epsilon:
+                    raise ValueError("Can't perform LU decomposition (division by 0).")
+            pivot_row = a[i * n + i + 1:i * n + k1]
+            for j in range(i+1, n):
+                a[j * n + i] /= pivot # divide column by pivot
+                l = a[j * n + i]
+                if l: # subtract the product of the pivot row and the column
+                    a[j * n + i + 1:j * n + k1] = array(a.typecode, [x - l * y for x, y in zip(a[j * n + i + 1:j * n + k1], pivot_row)])
+        return num_switches
+
+    def _lu_blocked(self, a, n, epsilon, permutation, block=None):
+        """
+        Right-looking blocked LU: factor a panel of columns, solve for the matching block row of U,
+        then update the trailing matrix with one matrix multiplication (A22 -= L21 @ U12).
+        Small matrices are factored as a single panel, which is the classic unblocked algorithm.
+        Input: a (array('d'), or array('f') for a single precision factorization - n x n, overwritten with L and U), n (int),
+               epsilon (float - tolerance for zero), permutation (list of ints, updated in place - or None for LU without pivoting),
+               block (int - panel width, optional).
+        Output: Number of row switches (int).
+        """
+        if block is None:
+            block = LU_BLOCK_SIZE if n >= LU_BLOCKED_SIZE else n
+        num_switches = 0
+        for k0 in range(0, n, block):
+            k1 = min(k0 + block, n)
+            num_switches += self._factor_panel(a, n, k0, k1, epsilon, permutation)
+            if k1 == n:
+                break
+            m = n - k1
+            for i in range(k0 + 1, k1): # U12 = inverse(L11) @ A12
+                row = a[i * n + k1:(i + 1) * n].tolist()
+                for p in range(k0, i):
+                    l = a[i * n + p]
+                    if l:
+                        row = [x - l * y for x, y in zip(row, a[p * n + k1:(p + 1) * n])]
+                a[i * n + k1:(i + 1) * n] = array(a.typecode, row)
+            l21, u12 = array(a.typecode), array(a.typecode)
+            for r in range(k1, n):
+                l21.extend(a[r * n + k0:r * n + k1])
+            for r in range(k0, k1):
+                u12.extend(a[r * n + k1:(r + 1) * n])
+            update = self.matmul(l21, u12, m, k1 - k0, m)
+            for r in range(m): # A22 -= L21 @ U12
+                start = (k1 + r) * n + k1
+                a[start:start + m] = array(a.typecode, map(sub, a[start:start + m], update[r * m:(r + 1) * m]))
+        return num_switches
+
+    def ldl(self, a, n, epsilon, modified):
+        """
+        Symmetric L D L^T decomposition (Cholesky without square roots). Only the lower triangle is eliminated, which is
+        half the work of LU, and the factors are stored in LU form (unit L below the diagonal, D @ L^T on and above it),
+        so the LU substitutions solve with them unchanged.
+        Unmodified, a pivot below epsilon raises an error (the matrix is not positive definite). Modified, small or
+        negative pivots are raised instead (Gill, Murray and Wright), so L D L^T factors a nearby positive definite matrix.
+        Input: a (array('d') - n x n symmetric, overwritten with the factors), n (int), epsilon (float - tolerance for zero),
+               modified (bool - modify the pivots instead of failing).
+        Output: True if the pivots were modified, False otherwise.
+        """
+        if modified:
+            gamma = max(abs(a[i * n + i]) for i in range(n))
+            xi = max((abs(a[i * n + j]) for i in range(n) for j in range(i)), default=0.)
+            beta2, delta = _modification_bounds(gamma, xi, n, epsilon)
+        was_modified = False
+        L, d = [[] for _ in range(n)], [] # L[i] grows by one element per eliminated column
+        for j in range(n):
+            w = list(map(mul, L[j], d))
+            column = [a[i * n + j] - sum(map(mul, L[i], w)) for i in range(j, n)]
+            pivot = column[0]
+            if modified:
+                theta = max(map(abs, column[1:]), default=0.)
+                pivot = max(abs(pivot), theta * theta / beta2, delta)
+                was_modified = was_modified or pivot != column[0]
+            elif pivot < epsilon:
+                raise ValueError("Can't perform Cholesky decomposition (matrix is not positive definite).")
+            d.append(pivot)
+            for i in range(j+1, n):
+                L[i].append(column[i - j] / pivot)
+        for i in range(n):
+            a[i * n + i] = d[i]
+            for j, l in enumerate(L[i]):
+                a[i * n + j], a[j * n + i] = l, d[j] * l
+        return was_modified
+
+    def permute_rows(self, b, permutation, m):
+        """
+        Gathers the rows of a right-hand side in pivot order (P @ b without forming P).
+        Input: b (array('d') - n x m), permutation (list of ints), m (int - number of columns).
+        Output: array('d') - n x m permuted copy.
+        """
+        if m == 1:
+            return array('d', [b[k] for k in permutation])
+        result = array('d')
+        for k in permutation:
+            result.extend(b[k * m:(k + 1) * m])
+        return result
+
+    def forward_substitution(self, lu, y, n, m):
+        """
+        Forward substitution with the unit lower triangle, on all m columns of the right-hand side.
+        Columns are processed in blocks of SOLVE_BLOCK_SIZE: each row of the block is updated as one list,
+        so L is walked once per block instead of once per column.
+        Input: lu (array('d') - n x n), y (array('d') - n x m, overwritten), n, m (int - dimensions).
+        Output: None.
+        """
+        if m == 1:
+            for i in range(n-1):
+                for j in range(i+1, n):
+                    # no need to divide by diagonal element because L has 1s on the diagonal
+                    y[j] -= lu[j * n + i] * y[i] # solve equation
+            return
+        for c0 in range(0, m, SOLVE_BLOCK_SIZE):
+            c1 = min(c0 + SOLVE_BLOCK_SIZE, m)
+            rows = [y[i * m + c0:i * m + c1].tolist() for i in range(n)]
+            for i in range(n-1):
+                y_i = rows[i]
+                if not any(y_i): # nothing to eliminate (e.g. leading rows of identity columns)
+                    continue
+                for j in range(i+1, n):
+                    l = lu[j * n + i]
+                    if l:
+                        rows[j] = [x - l * v for x, v in zip(rows[j], y_i)]
+            for i, row in enumerate(rows):
+                y[i * m + c0:i * m + c1] = array('d', row)
+
+    def backward_substitution(self, lu, y, n, m, epsilon):
+        """
+        Backward substitution with the upper triangle, on all m columns of the right-hand side (blocked like forward_substitution).
+        Input: lu (array('d') - n x n), y (array('d') - n x m, overwritten), n, m (int - dimensions), epsilon (float).
+        Output: None.
+        """
+        if m == 1:
+            for i in range(n-1, -1, -1):
+                if abs(lu[i * n + i]) < epsilon:
+                    raise ValueError("Can't perform backward substitution (division by 0).")
+                y[i] /= lu[i * n + i] # divide by diagonal element because U doesn't have 1s on the diagonal like L
+                for j in range(i):
+                    y[j] -= lu[j * n + i] * y[i] # same as forward substitution
+            return
+        for c0 in range(0, m, SOLVE_BLOCK_SIZE):
+            c1 = min(c0 + SOLVE_BLOCK_SIZE, m)
+            rows = [y[i * m + c0:i * m + c1].tolist() for i in range(n)]
+            for i in range(n-1, -1, -1):
+                pivot = lu[i * n + i]
+                if abs(pivot) < epsilon:
+                    raise ValueError("Can't perform backward substitution (division by 0).")
+                y_i = rows[i] = [v / pivot for v in rows[i]]
+                for j in range(i):
+                    u = lu[j * n + i]
+                    if u:
+                        rows[j] = [x - u * v for x, v in zip(rows[j], y_i)]
+            for i, row in enumerate(rows):
+                y[i * m + c0:i * m + c1] = array('d', row)
+
+class NumpyBackend(AbstractBackend):
+    """
+    Vectorized kernels working on flat float64 ndarrays.
+    """
+    name = 'numpy'
+
+    def zeros(self, size):
+        return np.zeros(size)
+
+    def from_values(self, values):
+        if isinstance(values, (list, array, np.ndarray)):
+            return np.array(values, dtype=np.float64)
+        return np.fromiter(values, dtype=np.float64)
+
+    def coerce(self, buffer):
+        return np.asarray(buffer, dtype=np.float64)
+
+    def pack(self, data, rows, cols, row_stride, col_stride):
+        strides = (row_stride * data.itemsize, col_stride * data.itemsize)
+        return np.lib.stride_tricks.as_strided(data, (rows, cols), strides).flatten()
+
+    def load_binary(self, file_name, offset, size, dtype):
+        """
+        Memory-maps the file copy-on-write: pages are read lazily and in-place changes never reach the file.
+        """
+        if not size:
+            return np.zeros(0)
+        buffer = np.memmap(file_name, dtype='<' + dtype, mode='c', offset=offset, shape=(size,))
+        return buffer if dtype == 'f8' and sys.byteorder == 'little' else buffer.astype(np.float64)
+
+    def write_binary(self, f, buffer, dtype):
+        np.ascontiguousarray(buffer, dtype='<' + dtype).tofile(f)
+
+    def extend(self, buffer, values):
+        return np.concatenate((buffer, np.asarray(values, dtype=np.float64)))
+
+    def single(self, buffer):
+        return buffer.astype(np.float32)
+
+    def scale_rows(self, a, scales, m):
+        return (a.reshape(-1, m) * np.asarray(scales)[:, None]).ravel()
+
+    def equal(self, a, b):
+        return bool(np.array_equal(a, b))
+
+    def add(self, a, b):
+        return a + b
+
+    def sub(self, a, b):
+        return a - b
+
+    def scale(self, a, scalar):
+        return a * scalar
+
+    def divide(self, a, scalar):
+        return a / scalar
+
+    def evaluate(self, expression, out=None):
+        result = expression.evaluate_nodes()
+        if out is None:
+            return np.asarray(result, dtype=np.float64)
+        out[:] = result
+        return out
+
+    def matmul(self, a, b, n, k, m):
+        return (a.reshape(n, k) @ self.coerce(b).reshape(k, m)).ravel()
+
+    def matmul_transposed(self, a, bt, n, k, m):
+        return (a.reshape(n, k) @ self.coerce(bt).reshape(m, k).T).ravel()
+
+    def normal_equations(self, j, r, n, k, m):
+        J = j.reshape(n, k)
+        return (J.T @ J).ravel(), (J.T @ r.reshape(n, m)).ravel()
+
+    def lu(self, a, n, epsilon):
+        self._lu_blocked(a, n, epsilon, None)
+
+    def lup(self, a, n, epsilon):
+        permutation = list(range(n))
+        num_switches = self._lu_blocked(a, n, epsilon, permutation)
+        return permutation, num_switches
+
+    def _lu_blocked(self, a, n, epsilon, permutation, block=None):
+        """
+        Same right-looking blocked algorithm as PythonBackend._lu_blocked, with the trailing update done by one BLAS matmul.
+        """
+        A = a.reshape(n, n)
+        if block is None:
+            block = LU_BLOCK_SIZE if n >= LU_BLOCKED_SIZE else n
+        num_switches = 0
+        for k0 in range(0, n, block):
+            k1 = min(k0 + block, n)
+            for i in range(k0, min(k1, n-1)):
+                if permutation is not None:
+                    p = i + int(np.argmax(np.abs(A[i:, i])))
+                    if p != i:
+                        num_switches += 1
+                        permutation[i], permutation[p] = permutation[p], permutation[i]
+                        A[[i, p]] = A[[p, i]]
+                    if A[i, i] == 0:
+                        continue
+                elif abs(A[i, i]) < epsilon:
+                    raise ValueError("Can't perform LU decomposition (division by 0).")
+                A[i+1:, i] /= A[i, i]
+                A[i+1:, i+1:k1] -= np.outer(A[i+1:, i], A[i, i+1:k1])
+            if k1 == n:
+                break
+            for i in range(k0 + 1, k1):
+                A[i, k1:] -= A[i, k0:i] @ A[k0:i, k1:]
+            A[k1:, k1:] -= A[k1:, k0:k1] @ A[k0:k1, k1:]
+        return num_switches
+
+    def ldl(self, a, n, epsilon, modified):
+        """
+        Same L D L^T decomposition as PythonBackend.ldl, with each column computed by one matrix-vector product.
+        """
+        A = a.reshape(n, n)
+        if modified:
+            beta2, delta = _modification_bounds(np.abs(A.diagonal()).max(), np.abs(np.tril(A, -1)).max(), n, epsilon)
+        was_modified = False
+        d = np.empty(n)
+        for j in range(n):
+            column = A[j:, j] - A[j:, :j] @ (A[j, :j] * d[:j])
+            pivot = column[0]
+            if modified:
+                theta = np.abs(column[1:]).max() if j < n-1 else 0.
+                pivot = max(abs(pivot), theta * theta / beta2, delta)
+                was_modified = was_modified or pivot != column[0]
+            elif pivot < epsilon:
+                raise ValueError("Can't perform Cholesky decomposition (matrix is not positive definite).")
+            d[j] = pivot
+            A[j+1:, j] = column[1:] / pivot
+        L = np.tril(A, -1)
+        A[:] = L + np.diag(d) + d[:, None] * L.T
+        return bool(was_modified)
+
+    def permute_rows(self, b, permutation, m):
+        return b.reshape(-1, m)[permutation].ravel()
+
+    def forward_substitution(self, lu, y, n, m):
+        L, Y = lu.reshape(n, n), y.reshape(n, m)
+        for i in range(n-1):
+            Y[i+1:] -= np.outer(L[i+1:, i], Y[i])
+
+    def backward_substitution(self, lu, y, n, m, epsilon):
+        U, Y = lu.reshape(n, n), y.reshape(n, m)
+        for i in range(n-1, -1, -1):
+            if abs(U[i, i]) < epsilon:
+                raise ValueError("Can't perform backward substitution (division by 0).")
+            Y[i] /= U[i, i]
+            Y[:i] -= np.outer(U[:i, i], Y[i])
+
+_backends = {'python': PythonBackend()}
+
+def _load_numpy():
+    """
+    Imports NumPy and registers the NumPy backend, on first use: importing NumPy takes longer than starting the
+    interpreter, so processes that only use the pure Python backend never pay for it.
+    Input: None.
+    Output: bool - True if NumPy is installed.
+    """
+    global np
+    if 'numpy' not in _backends:
+        try:
+            import numpy as np
+        except ImportError: # NumPy is optional, the pure Python backend works without it
+            return False
+        _backends['numpy'] = NumpyBackend()
+    return True
+
+def get_backend(name=None):
+    """
+    Returns the backend with the given name, falling back to the pure Python backend if NumPy is not installed.
+    Input: name (str - 'python' or 'numpy', optional - the default backend is used if omitted).
+    Output: AbstractBackend.
+    """
+    if name is None:
+        return _default_backend
+    if isinstance(name, AbstractBackend):
+        return name
+    if name not in ('python', 'numpy'):
+        raise ValueError(f"Unknown matrix backend '{name}'.")
+    if name == 'numpy' and not _load_numpy():
+        warnings.warn("NumPy is not installed, using the pure Python matrix backend.")
+        return _backends['python']
+    return _backends[name]
+
+def set_default_backend(name):
+    """
+    Sets the backend used by matrices that are created without an explicit backend.
+    Input: name (str - 'python' or 'numpy').
+    Output: None.
+    """
+    global _default_backend
+    _default_backend = get_backend(name)
+
+def set_parallel(workers=None, min_size=PARALLEL_MIN_SIZE):
+    """
+    Turns the parallel mode of the pure Python backend on or off. In parallel mode large matrix multiplications
+    (including the trailing updates of the blocked LU) and additions/subtractions are split by rows over a pool of
+    worker processes; the operands are passed through shared memory. The NumPy backend is not affected, its BLAS
+    already uses all cores.
+    Input: workers (int - number of processes, None for all cores, 1 turns the parallel mode off),
+           min_size (int - smaller operations stay in the calling process, see PARALLEL_MIN_SIZE).
+    Output: None.
+    """
+    global _workers, _parallel_min_size, _pool
+    workers = workers or os.cpu_count() or 1
+    if _pool is not None and workers != _workers:
+        _pool.shutdown()
+        _pool = None
+    _workers, _parallel_min_size = workers, min_size
+
+def set_strassen(min_size=None, leaf_size=STRASSEN_LEAF_SIZE):
+    """
+    Turns the Strassen-Winograd mode of the pure Python backend on or off. In Strassen mode square products from
+    min_size on are computed recursively, which is faster for large matrices but less accurate (see _matmul_strassen).
+    Parallel mode takes precedence. The NumPy backend is not affected.
+    Input: min_size (int - smallest matrix size that uses Strassen-Winograd, None turns the mode off),
+           leaf_size (int - blocks up to this size are multiplied with the classic kernels, see STRASSEN_LEAF_SIZE).
+    Output: None.
+    """
+    global _strassen_min_size, _strassen_leaf_size
+    if min_size is not None and min_size <= leaf_size:
+        raise ValueError("Strassen-Winograd needs a minimum size larger than the leaf size.")
+    _strassen_min_size, _strassen_leaf_size = min_size, leaf_size
+
+_default_backend = _backends['python']
+set_default_backend(os.environ.get('MATRIX_BACKEND', 'python'))
+_workers, _parallel_min_size, _pool = 1, PARALLEL_MIN_SIZE, None
+set_parallel(int(os.environ.get('MATRIX_WORKERS', '1')))
+_strassen_min_size, _strassen_leaf_size = None, STRASSEN_LEAF_SIZE
@@ -0,0 +1,262 @@
+from array import array
+
+from .backends import get_backend
+from .matrix import Matrix
+
+CLOSED_FORM_SIZE = 3 # matrices up to this size are solved, inverted and their determinants computed in closed form
+
+class BatchedMatrix:
+    """
+    Stack of count square n x n matrices stored in one flat buffer: matrix k occupies data[k*n*n:(k+1)*n*n], row-major.
+    Element (i, j) of every matrix is the strided slice data[i*n + j::n*n], so the closed-form kernels for n <= 3
+    (2x2 and 3x3 Hessians and Jacobians) run one list comprehension per formula over the whole batch. Larger
+    matrices fall back to one LUP factorization per matrix. No Matrix objects are created for the batch itself.
+    """
+    def __init__(self, count, n, data=None):
+        """
+        Initializes a stack of matrices from a flat buffer (zero matrices if it is omitted).
+        Input: count (int - number of matrices), n (int - size of every matrix), data (iterable of floats - count * n * n, optional).
+        Output: None.
+        """
+        self.count = count
+        self.n = n
+        self.data = array('d', data if data is not None else bytes(8 * count * n * n))
+        if len(self.data) != count * n * n:
+            raise ValueError(f"Expected {count * n * n} elements for {count} matrices of size {n} x {n}.")
+        self._factors = {} # cached inverses (n <= CLOSED_FORM_SIZE) or LUP factors per epsilon, reset on modification
+
+    @classmethod
+    def from_matrices(cls, matrices):
+        """
+        Stacks square matrices of the same size.
+        Input: matrices (list of Matrix or list of lists of lists of floats).
+        Output: BatchedMatrix.
+        """
+        data = array('d')
+        n = None
+        for matrix in matrices:
+            if not isinstance(matrix, Matrix):
+                matrix = Matrix(data=matrix, backend='python')
+            if matrix.rows != matrix.cols or (n is not None and matrix.rows != n):
+                raise ValueError("All matrices of a batch must be square and of the same size.")
+            n = matrix.rows
+            data.extend(matrix._flat())
+        return cls(len(matrices), n or 0, data)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"BatchedMatrix({self.count} x {self.n} x {self.n})"
+
+    def __getitem__(self, k):
+        """
+        Returns a copy of matrix k.
+        Input: k (int).
+        Output: Matrix.
+        """
+        size = self.n * self.n
+        return Matrix._from_buffer(self.n, self.n, self.data[k * size:(k + 1) * size], get_backend('python'))
+
+    def __setitem__(self, k, matrix):
+        """
+        Replaces matrix k.
+        Input: k (int), matrix (Matrix - n x n).
+        Output: None.
+        """
+        if matrix.rows != self.n or matrix.cols != self.n:
+            raise ValueError(f"Matrix must be {self.n} x {self.n}.")
+        size = self.n * self.n
+        self.data[k * size:(k + 1) * size] = array('d', matrix._flat())
+        self._factors = {}
+
+    def _components(self, buffer=None):
+        """
+        Splits a batch into its components: component i * n + j holds element (i, j) of every matrix.
+        Input: buffer (array('d') - count * n * n, optional - defaults to the matrices of the batch).
+        Output: list of n * n arrays of length count.
+        """
+        buffer = self.data if buffer is None else buffer
+        size = self.n * self.n
+        return [buffer[c::size] for c in range(size)]
+
+    def _vectors(self, b):
+        """
+        Converts the right-hand sides to a flat buffer: vector k occupies [k*n:(k+1)*n].
+        Input: b (flat iterable of floats - count * n, or one vector per matrix: Points, n x 1 Matrices or lists).
+        Output: array('d') - count * n.
+        """
+        if len(b) and isinstance(b[0], (int, float)): # one flat sequence of scalars
+            flat = array('d', b)
+            if len(flat) != self.count * self.n:
+                raise ValueError(f"Expected {self.count * self.n} right-hand side elements.")
+            return flat
+        flat = array('d')
+        for vector in b:
+            if isinstance(vector, Matrix):
+                vector = vector._flat()
+            elif hasattr(vector, 'coordinates'): # Point
+                vector = vector.coordinates
+            if len(vector) != self.n:
+                raise ValueError(f"Right-hand side has {len(vector)} elements, expected {self.n}.")
+            flat.extend(vector)
+        if len(flat) != self.count * self.n:
+            raise ValueError(f"Expected {self.count} right-hand sides.")
+        return flat
+
+    def determinant(self):
+        """
+        Computes the determinant of every matrix (closed form for n <= 3, from the LUP factors otherwise).
+        Input: None.
+        Output: list of floats.
+        """
+        n = self.n
+        if n == 1:
+            return self.data.tolist()
+        if n == 2:
+            a, b, c, d = self._components()
+            return [p * s - q * r for p, q, r, s in zip(a, b, c, d)]
+        if n == 3:
+            return [a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+                    for a, b, c, d, e, f, g, h, i in zip(*self._components())]
+        determinants = []
+        for lu, permutation, num_switches in self._lup_factors():
+            det = 1. if num_switches % 2 == 0 else -1.
+            for i in range(n):
+                det *= lu[i * n + i]
+            determinants.append(det)
+        return determinants
+
+    def _singular(self, determinants, epsilon):
+        """
+        Finds the first singular matrix: |det| < epsilon * s^(n-1), with s the largest absolute element of the matrix,
+        i.e. a pivot below epsilon relative to the scale of the other pivots.
+        Input: determinants (list of floats), epsilon (float - tolerance for zero).
+        Output: Index of the first singular matrix (int), or None.
+        """
+        size = self.n * self.n
+        bound = epsilon * max(map(abs, self.data), default=0.) ** (self.n - 1) # the largest element of the whole batch
+        for k, det in enumerate(determinants):
+            if abs(det) < bound and abs(det) < epsilon * max(map(abs, self.data[k * size:(k + 1) * size])) ** (self.n - 1):
+                return k
+        return None
+
+    def _lup_factors(self, epsilon=1e-8):
+        """
+        Factorizes every matrix separately with the pure Python LUP kernel (matrices larger than CLOSED_FORM_SIZE).
+        Input: epsilon (float - tolerance for zero).
+        Output: list of (LU factors (array('d')), permutation (list of ints), number of row switches (int)).
+        """
+        factors = self._factors.get(epsilon)
+        if factors is None:
+            backend, n, size = get_backend('python'), self.n, self.n * self.n
+            factors = []
+            for k in range(self.count):
+                lu = self.data[k * size:(k + 1) * size]
+                permutation, num_switches = backend.lup(lu, n, epsilon)
+                factors.append((lu, permutation, num_switches))
+            self._factors[epsilon] = factors
+        return factors
+
+    def _closed_form_inverse(self, epsilon=1e-8):
+        """
+        Inverts every matrix with the adjugate formula, A^-1 = adj(A) / det(A) (n <= 3); the inverses are cached per
+        epsilon and reused by later solves until a matrix is replaced.
+        Input: epsilon (float - tolerance for zero).
+        Output: list of n * n arrays of length count (components of the inverses, see _components).
+        """
+        if epsilon in self._factors:
+            return self._factors[epsilon]
+        n = self.n
+        determinants = self.determinant()
+        k = self._singular(determinants, epsilon)
+        if k is not None:
+            raise ValueError(f"Matrix {k} of the batch is singular.")
+        scale = [1. / det for det in determinants]
+        if n == 1:
+            inverse = [scale]
+        elif n == 2:
+            a, b, c, d = self._components()
+            inverse = [[s * t for s, t in zip(d, scale)], [-s * t for s, t in zip(b, scale)],
+                       [-s * t for s, t in zip(c, scale)], [s * t for s, t in zip(a, scale)]]
+        else:
+            a, b, c, d, e, f, g, h, i = self._components()
+            cofactors = [ # adj(A)[r][c] = cofactor (c, r) of A
+                (e, i, f, h), (c, h, b, i), (b, f, c, e),
+                (f, g, d, i), (a, i, c, g), (c, d, a, f),
+                (d, h, e, g), (b, g, a, h), (a, e, b, d),
+            ]
+            inverse = [[(p * q - r * s) * t for p, q, r, s, t in zip(w, x, y, z, scale)] for w, x, y, z in cofactors]
+        self._factors[epsilon] = [array('d', component) for component in inverse]
+        return self._factors[epsilon]
+
+    def factorize(self, epsilon=1e-8):
+        """
+        Factorizes the whole batch ahead of the solves: closed-form inverses for n <= 3, LUP factors otherwise.
+        The factors are cached, so solving the same batch for new right-hand sides only pays for substitutions.
+        Input: epsilon (float - tolerance for zero).
+        Output: None.
+        """
+        if self.n <= CLOSED_FORM_SIZE:
+            self._closed_form_inverse(epsilon)
+        else:
+            self._lup_factors(epsilon)
+
+    def solve(self, b, epsilon=1e-8):
+        """
+        Solves A_k x_k = b_k for every matrix of the batch.
+        Input: b (count * n flat iterable of floats, or a sequence of count vectors - Points, n x 1 Matrices or lists),
+               epsilon (float - tolerance for zero).
+        Output: array('d') - count * n, solution k occupies [k*n:(k+1)*n].
+        """
+        n = self.n
+        y = self._vectors(b)
+        if n <= CLOSED_FORM_SIZE:
+            inverse = self._closed_form_inverse(epsilon)
+            rhs = [y[i::n] for i in range(n)]
+            x = array('d', bytes(8 * len(y)))
+            for i in range(n): # x_i = sum_j inverse_ij b_j, for the whole batch at once
+                row = inverse[i * n:(i + 1) * n]
+                if n == 1:
+                    x[i::n] = array('d', [p * u for p, u in zip(row[0], rhs[0])])
+                elif n == 2:
+                    x[i::n] = array('d', [p * u + q * v for p, q, u, v in zip(*row, *rhs)])
+                else:
+                    x[i::n] = array('d', [p * u + q * v + r * w for p, q, r, u, v, w in zip(*row, *rhs)])
+            return x
+        backend = get_backend('python')
+        x = array('d')
+        for k, (lu, permutation, num_switches) in enumerate(self._lup_factors(epsilon)):
+            x_k = backend.permute_rows(y[k * n:(k + 1) * n], permutation, 1)
+            backend.forward_substitution(lu, x_k, n, 1)
+            try:
+                backend.backward_substitution(lu, x_k, n, 1, epsilon)
+            except ValueError:
+                raise ValueError(f"Matrix {k} of the batch is singular.") from None
+            x.extend(x_k)
+        return x
+
+    def inverse(self, epsilon=1e-8):
+        """
+        Computes the inverse of every matrix of the batch.
+        Input: epsilon (float - tolerance for zero).
+        Output: BatchedMatrix.
+        """
+        n, size = self.n, self.n * self.n
+        result = BatchedMatrix(self.count, n)
+        if n <= CLOSED_FORM_SIZE:
+            for c, component in enumerate(self._closed_form_inverse(epsilon)):
+                result.data[c::size] = component
+            return result
+        backend = get_backend('python')
+        for k, (lu, permutation, num_switches) in enumerate(self._lup_factors(epsilon)):
+            identity = array('d', bytes(8 * size))
+            identity[::n + 1] = array('d', [1.] * n)
+            x = backend.permute_rows(identity, permutation, n)
+            backend.forward_substitution(lu, x, n, n)
+            try:
+                backend.backward_substitution(lu, x, n, n, epsilon)
+            except ValueError:
+                raise ValueError(f"Matrix {k} of the batch is singular.") from None
+            result.data[k * size:(k + 1) * size] = x
+        return result
@@ -0,0 +1,95 @@
+from array import array
+from itertools import islice
+from operator import add, sub, mul, truediv
+
+OPERATORS = {'+': add, '-': sub, '*': mul, '/': truediv, '**': pow}
+_loops = {} # compiled loops, one per expression shape
+MAX_EXPRESSION_DEPTH = 32 # deeper operands are evaluated first (keeps the generated loops small)
+FUSE_MIN_SIZE = 256 # smaller operands are computed right away, building the tree would cost more than the temporaries
+OUT_BLOCK_SIZE = 4096 # evaluate(out): elements computed and written into out at a time (bounds the temporaries)
+
+class Expression:
+    """
+    Lazy elementwise expression: a tree of +, -, *, / and ** nodes whose leaves are equally long flat buffers
+    (array('d'), lists or ndarrays) and scalars. Building it computes nothing; evaluate() runs the whole tree
+    as one loop that produces one output list (or writes into a given buffer), instead of one temporary per operator.
+    """
+    __slots__ = ('op', 'left', 'right', 'depth')
+
+    def __init__(self, op, left, right):
+        """
+        Initializes an expression node.
+        Input: op (str - '+', '-', '*', '/' or '**'), left, right (Expression, flat buffer or scalar).
+        Output: None.
+        """
+        self.op = op
+        self.left = left
+        self.right = right
+        self.depth = 1 + max(operand.depth if isinstance(operand, Expression) else 0 for operand in (left, right))
+
+    def _source(self, buffers, scalars):
+        """
+        Builds the loop body of the expression and collects its leaves (every distinct buffer once).
+        Input: buffers (list, extended with the buffer leaves), scalars (list, extended with the scalar leaves).
+        Output: Source code of the elementwise formula (str).
+        """
+        parts = []
+        for operand in (self.left, self.right):
+            if isinstance(operand, Expression):
+                parts.append(operand._source(buffers, scalars))
+            elif not hasattr(operand, '__len__'): # scalar
+                scalars.append(operand)
+                parts.append(f"c{len(scalars) - 1}")
+            else:
+                for k, buffer in enumerate(buffers):
+                    if buffer is operand:
+                        break
+                else:
+                    buffers.append(operand)
+                    k = len(buffers) - 1
+                parts.append(f"x{k}")
+        return f"({parts[0]} {self.op} {parts[1]})"
+
+    def evaluate(self, out=None):
+        """
+        Evaluates the expression with one list comprehension over all buffers, or with one loop that assigns every
+        element into out. The loop is generated and compiled once per expression shape (the scalars are its
+        arguments), so e.g. every (1 + a) * x - a * y reuses the same loop. out may be one of the leaves, every
+        element is read before it is written.
+        Input: out (mutable buffer as long as the leaves, optional).
+        Output: list of floats (out, if given).
+        """
+        buffers, scalars = [], []
+        body = self._source(buffers, scalars)
+        key = (body, len(buffers), out is not None)
+        loop = _loops.get(key)
+        if loop is None:
+            names = ''.join(f"x{k}, " for k in range(len(buffers)))
+            arguments = ''.join(f", c{k}" for k in range(len(scalars)))
+            if out is None:
+                loop = eval(f"lambda buffers{arguments}: [{body} for {names}in zip(*buffers)]")
+            else:
+                namespace = {'array': array, 'islice': islice, 'OUT_BLOCK_SIZE': OUT_BLOCK_SIZE}
+                exec(f"def loop(out, buffers{arguments}):\n"
+                     f"    values = zip(*buffers)\n"
+                     f"    typed = isinstance(out, array)\n"
+                     f"    for start in range(0, len(out), OUT_BLOCK_SIZE):\n"
+                     f"        block = [{body} for {names}in islice(values, OUT_BLOCK_SIZE)]\n"
+                     f"        out[start:start + OUT_BLOCK_SIZE] = array('d', block) if typed else block\n", namespace)
+                loop = namespace['loop']
+            _loops[key] = loop
+        if out is None:
+            return loop(buffers, *scalars)
+        loop(out, buffers, *scalars)
+        return out
+
+    def evaluate_nodes(self):
+        """
+        Evaluates the expression node by node with whole-buffer operators (for vectorized buffers such as ndarrays,
+        whose operators already run in one native loop each).
+        Input: None.
+        Output: Result buffer.
+        """
+        left, right = [operand.evaluate_nodes() if isinstance(operand, Expression) else operand
+                       for operand in (self.left, self.right)]
+        return OPERATORS[self.op](left, right)
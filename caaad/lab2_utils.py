@@ -0,0 +1,384 @@
+from bisect import bisect_right
+import math
+import sys
+
+from .point import Point
+
+# return_middle also returns the interior point of the interval and its value, f(middle) <= f(left), f(right)
+def find_unimodal_interval(f, start_point, step=1, return_num_iterations=False, return_middle=False):
+    left = start_point - step
+    right = start_point + step
+    middle = start_point
+    num_iterations = 0
+    f_left = f(left)
+    f_middle = f(middle)
+    f_right = f(right)
+    num_iterations += 3
+    
+    if f_middle > f_left:
+        while f_middle > f_left:
+            right = middle
+            middle = left
+            left = middle - step
+            f_middle = f_left
+            f_left = f(left)
+            num_iterations += 1
+            step *= 2
+    else:
+        while f_middle > f_right:
+            left = middle
+            middle = right
+            right = middle + step
+            f_middle = f_right
+            f_right = f(right)
+            num_iterations += 1
+            step *= 2
+
+    result = (left, right)
+    if return_middle:
+        result += ((middle, f_middle),)
+    if return_num_iterations:
+        result += (num_iterations,)
+    return result
+
+def _search_interval(f, start_point, a, b, step):
+    # interval of a line search: [a, b] if given, otherwise the unimodal interval around start_point together with
+    # the interior point the bracketing evaluated, (point, value), which the search reuses (None for a given [a, b])
+    if a is None and b is None:
+        if start_point is None:
+            raise ValueError("You must provide either start_point or a and b")
+        if isinstance(start_point, Point):
+            if start_point.dim > 1:
+                raise ValueError("This function only works for single variable functions")
+            start_point = start_point[0]
+        return find_unimodal_interval(f, start_point, step, return_num_iterations=True, return_middle=True)
+    return a, b, None, 0
+
+# always returns float because it only works for single variable functions
+# Keeps a triplet a < x < b with the best point x found so far and probes the larger of [a, x] and [x, b], at the
+# golden section point of it seen from x. The bracketing point of find_unimodal_interval is the starting x, so only
+# one new point is evaluated per step from the start; for a given [a, b], x starts at the left golden section point
+# and the probes are the ones of the classic two-point form. Returns x, which is within e of the minimum.
+def golden_section_search(f, start_point=None, a=None, b=None, step=1, e=1e-6, print_steps=False, return_num_iterations=False):
+    k = (5**0.5 - 1) / 2
+    a, b, middle, num_iterations = _search_interval(f, start_point, a, b, step)
+    if middle is None:
+        x = b - k * (b - a)
+        fx = f(x)
+        num_iterations += 1
+    else:
+        x, fx = middle
+    cnt = 1
+    while (b - a) >= e:
+        if print_steps:
+            print(f"STEP {cnt}:")
+            print(f"a: {a}\nb: {b}\nx: {x}\nf(a): {f(a)}\nf(b):{f(b)}\nf(x): {fx}")
+            print("-----------------------------------")
+        cnt += 1
+        if x - a > b - x:
+            u = x - (1 - k) * (x - a)
+        else:
+            u = x + (1 - k) * (b - x)
+        fu = f(u)
+        num_iterations += 1
+        if fu < fx or (fu == fx and u > x): # ties keep the right point, as the two-point form does
+            if u < x:
+                b = x
+            else:
+                a = x
+            x, fx = u, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+
+    if return_num_iterations:
+        return float(x), num_iterations
+    return float(x)
+
+# Brent's method: parabolic interpolation through the three best points, with a golden section step whenever the
+# parabola is not trusted, so smooth functions converge superlinearly and the rest no slower than golden section.
+# Same interface as golden_section_search, the result is within e/2 of the minimum of the interval.
+def brent_search(f, start_point=None, a=None, b=None, step=1, e=1e-6, print_steps=False, return_num_iterations=False):
+    k = (3 - 5**0.5) / 2
+    a, b, middle, num_iterations = _search_interval(f, start_point, a, b, step)
+    a, b = min(a, b), max(a, b)
+    if middle is None:
+        x = a + k * (b - a)
+        fx = f(x)
+        num_iterations += 1
+    else:
+        x, fx = middle
+    w = v = x # x is the best point, w the second best and v the previous w
+    fw = fv = fx
+    d = last_d = 0. # current and previous step
+    cnt = 1
+    while True:
+        xm = (a + b) / 2
+        tol = e / 4 + sys.float_info.epsilon * abs(x)
+        if abs(x - xm) <= 2 * tol - (b - a) / 2:
+            break
+        if print_steps:
+            print(f"STEP {cnt}:")
+            print(f"a: {a}\nb: {b}\nx: {x}\nf(x): {fx}")
+            print("-----------------------------------")
+        cnt += 1
+        parabolic = False
+        if abs(last_d) > tol:
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+            # accept the parabola's minimum if it lies inside [a, b] and the step is less than half the one before last
+            if abs(p) < abs(q * last_d / 2) and q * (a - x) < p < q * (b - x):
+                parabolic = True
+                last_d, d = d, p / q
+                if (x + d) - a < 2 * tol or b - (x + d) < 2 * tol:
+                    d = math.copysign(tol, xm - x)
+        if not parabolic:
+            last_d = (a - x) if x >= xm else (b - x)
+            d = k * last_d
+        u = x + (d if abs(d) >= tol else math.copysign(tol, d))
+        fu = f(u)
+        num_iterations += 1
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v = u
+                fv = fu
+
+    if return_num_iterations:
+        return float(x), num_iterations
+    return float(x)
+
+def scale_dimensions(vector, n):
+    if len(vector) > 1 and len(vector) != n:
+        raise ValueError(f"The length of {vector} must be equal to the number of dimensions of x0 ({n})")
+    if len(vector) == 1 and n > 1:
+        vector = vector * n
+    return vector
+
+# returns float if x0 is a single variable, otherwise returns list
+def coordinate_search(f, x0, e=[1e-6], max_iter=1000, return_num_iterations=False, line_search=golden_section_search):
+    x = x0
+    n = x.dim
+    e = scale_dimensions(e, n)
+    num_iterations = 0
+    
+    for i in range(max_iter):
+        x_prev = x.copy()
+        
+        for j in range(n):
+            def line_goal_function(lambda_):
+                x_temp = x.copy()
+                x_temp[j] += lambda_ # * 1 because we are working with perpendicular lines
+                return f(x_temp)
+            
+            if not return_num_iterations:
+                lambda_opt = line_search(line_goal_function, start_point=x_prev[j], return_num_iterations=return_num_iterations)
+            else:
+                lambda_opt, num_iter = line_search(line_goal_function, start_point=x_prev[j], return_num_iterations=return_num_iterations)
+                num_iterations += num_iter
+            x[j] += lambda_opt
+
+        if all(abs(x[k] - x_prev[k]) <= e[k] for k in range(n)):
+            break
+    
+    if return_num_iterations:
+        return x, num_iterations
+    return x
+
+class LatticeCache:
+    # values of f on the lattice x0 + k * delta_x probed by one Hooke-Jeeves run, keyed by the integer coordinates k,
+    # so a point is evaluated once even when explore and the pattern moves reach it again after the step is halved
+    def __init__(self, f, x0, delta_x):
+        self.f = f
+        self.origin = list(x0.coordinates)
+        self.delta_x = list(delta_x)
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, x):
+        return tuple(round((xi - oi) / di) if di else xi for xi, oi, di in zip(x.coordinates, self.origin, self.delta_x))
+
+    def __call__(self, x):
+        key = self.key(x)
+        value = self.values.get(key)
+        if value is None:
+            self.misses += 1
+            value = self.values[key] = self.f(x)
+        else:
+            self.hits += 1
+        return value
+
+    def refine(self, delta_x):
+        # the lattice of a halved step contains the old one, the old keys are scaled to the new step
+        scale = [round(d / new_d) if new_d else 1 for d, new_d in zip(self.delta_x, delta_x)]
+        self.values = {tuple(k * s for k, s in zip(key, scale)): value for key, value in self.values.items()}
+        self.delta_x = list(delta_x)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'points': len(self.values)}
+
+def explore(f, xp, delta_x, return_num_iterations=False):
+    x = xp.copy()
+    P = f(x) # value at the current x, updated whenever a step is accepted
+    num_iterations = 1
+    for i in range(x.dim):
+        x[i] += delta_x[i]
+        N = f(x)
+        num_iterations += 1
+        if N > P:
+            x[i] -= 2 * delta_x[i]
+            N = f(x)
+            num_iterations += 1
+            if N > P:
+                x[i] += delta_x[i]
+                continue
+        P = N
+
+    if not return_num_iterations:
+        return x
+    return x, num_iterations
+
+def hooke_jeeves(f, x0, e=[1e-6], delta_x=[0.5], max_iter=1000, return_num_iterations=False, print_steps=False, return_cache_stats=False):
+    x = x0
+    xp = x.copy()
+    xb = x.copy()
+    n = x.dim
+    e = scale_dimensions(e, n)
+    delta_x = scale_dimensions(delta_x, n)
+    f = LatticeCache(f, x0, delta_x)
+
+    for i in range(max_iter):
+        xn = explore(f, xp, delta_x)
+        if print_steps:
+            print(f"STEP {i+1}:")
+            print(f"xb: {xb}\nf(xb): {f(xb)}")
+            print(f"xp: {xp}\nf(xp): {f(xp)}")
+            print(f"xn: {xn}\nf(xn): {f(xn)}")
+            print("-----------------------------------")
+        if f(xn) < f(xb):
+            xp = Point([2 * xn[i] - xb[i] for i in range(xn.dim)])
+            xb = xn.copy()
+        else:
+            delta_x = [delta_x[i] / 2 for i in range(n)]
+            f.refine(delta_x)
+            xp = xb.copy()
+
+        if all(delta_x[i] <= e[i] for i in range(n)):
+            break
+
+    result = (xb,)
+    if return_num_iterations:
+        result += (f.misses,) # number of evaluations of f
+    if return_cache_stats:
+        result += (f.stats(),)
+    return result if len(result) > 1 else xb
+
+def generate_initial_simplex(x0, step):
+    simplex = [x0]
+    for i in range(x0.dim):
+        new_point = x0.copy()
+        new_point[i] += step
+        simplex.append(new_point)
+    return simplex
+
+class Simplex:
+    # vertices stored with their function values and kept sorted by them (best first), so every point is evaluated once
+    def __init__(self, f, points):
+        self.f = f
+        self.num_evaluations = 0
+        self._sort(points, [self.evaluate(p) for p in points])
+
+    def _sort(self, points, values):
+        order = sorted(range(len(points)), key=values.__getitem__) # stable, ties keep their previous order
+        self.points = [points[k] for k in order]
+        self.values = [values[k] for k in order]
+
+    def evaluate(self, point):
+        self.num_evaluations += 1
+        return self.f(point)
+
+    def __len__(self):
+        return len(self.points)
+
+    def __getitem__(self, i):
+        return self.points[i]
+
+    def replace_worst(self, point, value):
+        self.points.pop()
+        self.values.pop()
+        k = bisect_right(self.values, value)
+        self.points.insert(k, point)
+        self.values.insert(k, value)
+
+    def shrink(self, sigma):
+        best, f_best = self.points[0], self.values[0]
+        points = [sigma * (p + best) for p in self.points] # move towards the best point
+        # the best point only moves if sigma != 0.5
+        values = [f_best if k == 0 and 2 * sigma == 1 else self.evaluate(p) for k, p in enumerate(points)]
+        self._sort(points, values)
+
+def nelder_mead(f, x0, step=1, alpha=1, beta=0.5, gamma=2, sigma=0.5, e=1e-6, max_iter=1000, return_num_iterations=False, print_steps=False):
+    x = Simplex(f, generate_initial_simplex(x0, step))
+    l = 0  # best
+    h = -1  # worst
+
+    for i in range(max_iter):
+        xc = Point([(sum(p[j] for p in x) - x[h][j]) / (len(x) - 1) for j in range(x[h].dim)]) # centroid
+        if print_steps:
+            print(f"STEP {i+1}:")
+            print(f"Centroid: {xc}")
+            print("f(Optimum): ", x.values[l])
+            print("-----------------------------------")
+        xr = (1 + alpha) * xc - alpha * x[h] # reflection
+        fr = x.evaluate(xr)
+        if fr < x.values[l]:
+            xe = (1 - gamma) * xc + gamma * xr # expansion
+            fe = x.evaluate(xe)
+            if fe < x.values[l]:
+                x.replace_worst(xe, fe)
+            else:
+                x.replace_worst(xr, fr)
+        elif fr > x.values[-2]:
+            if fr < x.values[h]:
+                x.replace_worst(xr, fr)
+            xk = (1 - beta) * xc + beta * x[h] # contraction
+            fk = x.evaluate(xk)
+            if fk < x.values[h]:
+                x.replace_worst(xk, fk)
+            else:
+                x.shrink(sigma)
+        else:
+            x.replace_worst(xr, fr)
+
+        # i don't know which condition to use for stopping the algorithm
+        f_values = x.values
+        mean_f = sum(f_values) / len(f_values)
+        variance_f = sum((fv - mean_f) ** 2 for fv in f_values) / len(f_values)
+        std_f = variance_f ** 0.5
+        if std_f < e:
+            break
+
+    if return_num_iterations:
+        return x[l], x.num_evaluations
+    return x[l]
\ No newline at end of file
@@ -1,18 +1,19 @@
-from lab2_utils import golden_section_search
-from functions import *
+from .lab2_utils import golden_section_search
 
-def gradient_descent(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
+# use_golden_section turns the line search on (otherwise a fixed step is taken), line_search is the 1D minimizer
+# it uses: golden_section_search or brent_search, which needs far fewer evaluations on smooth functions
+def gradient_descent(f, x0, e=1e-6, use_golden_section=True, max_iter=10000, line_search=golden_section_search):
     x = x0.copy()
     best_f_value = f(x.copy())
     no_improvement_count = 0
-    grad = f.gradient(x.copy()).to_point()
+    grad = f.gradient(x.copy())
     for i in range(max_iter):
         if use_golden_section:
-            lambda_ = golden_section_search(lambda l: f.f_lambda(x, grad, l), 0)
+            lambda_ = line_search(lambda l: f.f_lambda(x, grad, l), 0)
         else:
             lambda_ = -1.
-        x += lambda_ * grad
-        grad = f.gradient(x.copy()).to_point()
+        x.axpy(lambda_, grad)
+        grad = f.gradient(x.copy())
 
         if best_f_value <= f(x):
             no_improvement_count += 1
@@ -23,26 +24,25 @@ def gradient_descent(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
             best_f_value = f(x.copy())
             no_improvement_count = 0
 
-        if grad.euclidean_norm() < e:
+        if grad.norm() < e:
             break
 
     return x
 
-def newton_raphson(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
+def newton_raphson(f, x0, e=1e-6, use_golden_section=True, max_iter=10000, line_search=golden_section_search):
     x = x0.copy()
     best_f_value = f(x.copy())
     no_improvement_count = 0
     for i in range(max_iter):
         grad = f.gradient(x.copy())
         hessian = f.hessian(x.copy())
-        hessian.LUP_decomposition()
-        delta_x = -1 * hessian.solve(grad).to_point()
+        delta_x = -1 * hessian.solve(grad, method='modified_cholesky') # always a descent direction
         if use_golden_section:
-            lambda_ = golden_section_search(lambda l: f.f_lambda(x, delta_x, l), 0)
+            lambda_ = line_search(lambda l: f.f_lambda(x, delta_x, l), 0)
         else:
             lambda_ = 1.
         
-        x += lambda_ * delta_x
+        x.axpy(lambda_, delta_x)
 
         if best_f_value <= f(x):
             no_improvement_count += 1
@@ -53,12 +53,12 @@ def newton_raphson(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
             best_f_value = f(x.copy())
             no_improvement_count = 0
 
-        if delta_x.euclidean_norm() < e:
+        if delta_x.norm() < e:
             break
 
     return x
 
-def gauss_newton(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
+def gauss_newton(f, x0, e=1e-6, use_golden_section=True, max_iter=10000, line_search=golden_section_search):
     x = x0.copy()
     best_f_value = f(x.copy())
     no_improvement_count = 0
@@ -66,19 +66,19 @@ def gauss_newton(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
         jacobian = f.jacobian(x.copy())
         G = f.g(x.copy())
         if jacobian.rows != jacobian.cols:
-            A = ~jacobian @ jacobian
-            g = ~jacobian @ G
+            A, g = jacobian.normal_equations(G) # A = J^T J is symmetric positive semidefinite, g = J^T G
+            method = 'modified_cholesky'
         else:
             A = jacobian
             g = G
-        A.LUP_decomposition()
-        delta_x = -1 * A.solve(g).to_point()
+            method = 'lup'
+        delta_x = -1 * A.solve(g, method=method)
         if use_golden_section:
-            lambda_ = golden_section_search(lambda l: f.f_lambda(x, delta_x, l), 0)
+            lambda_ = line_search(lambda l: f.f_lambda(x, delta_x, l), 0)
         else:
             lambda_ = 1.
         
-        x += lambda_ * delta_x
+        x.axpy(lambda_, delta_x)
 
         if best_f_value <= f(x):
             no_improvement_count += 1
@@ -89,6 +89,6 @@ def gauss_newton(f, x0, e=1e-6, use_golden_section=True, max_iter=10000):
             best_f_value = f(x.copy())
             no_improvement_count = 0
 
-        if delta_x.euclidean_norm() < e:
+        if delta_x.norm() < e:
             break
     return x
\ No newline at end of file
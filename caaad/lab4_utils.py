@@ -1,8 +1,8 @@
-from functions import *
-from point import Point
-from lab2_utils import hooke_jeeves
-import random
 import math
+import random
+
+from .lab2_utils import hooke_jeeves
+from .point import Point
 
 def satisfies_inequality_constraints(point, constraints):
     return all(constraint(point) > 0 for constraint in constraints)
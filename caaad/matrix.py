@@ -0,0 +1,978 @@
+from array import array
+import math
+import struct
+import sys
+
+from .backends import get_backend
+from .expression import Expression, FUSE_MIN_SIZE, MAX_EXPRESSION_DEPTH
+
+# binary matrix file: 64 byte header (magic, dtype 'f8'/'f4', layout 'C' row-major/'F' column-major, rows, cols),
+# followed by the raw little-endian elements, so the data can be memory-mapped without parsing
+MATRIX_FILE_MAGIC = b'\x93MATRIX\x01'
+MATRIX_FILE_HEADER = struct.Struct('<8s2scxQQ')
+MATRIX_FILE_HEADER_SIZE = 64
+
+MAX_REFINEMENT_SWEEPS = 10 # residual corrections a mixed precision solve may take to reach double precision accuracy
+
+def _is_point(operand):
+    """
+    Checks if an operand is a Point, which matrix products and solves accept as an n x 1 vector.
+    Input: operand (any).
+    Output: bool.
+    """
+    return hasattr(operand, 'coordinates')
+
+class _MatrixRow:
+    """
+    Lightweight view of one matrix row, so that A[i][j] keeps working on top of the flat buffer.
+    Only the row index is kept: the buffer, its strides and the shape are read from the matrix on every access,
+    because the matrix may repack its buffer (_make_contiguous) while the view is alive.
+    """
+    __slots__ = ('matrix', 'i')
+
+    def __init__(self, matrix, i):
+        """
+        Initializes a view of row i of the matrix.
+        Input: matrix (Matrix), i (int - row index).
+        Output: None.
+        """
+        self.matrix = matrix
+        self.i = i
+
+    def __len__(self):
+        return self.matrix.cols
+
+    def _index(self, j):
+        """
+        Returns the buffer position of column j of the row.
+        Input: j (int - column index).
+        Output: int.
+        """
+        return self.matrix._position(self.i, j)
+
+    def __getitem__(self, j):
+        """
+        Returns the element in column j of the row (or a list of elements for a slice).
+        Input: j (int or slice - column index).
+        Output: float (or list of floats).
+        """
+        if isinstance(j, slice):
+            return [self[k] for k in range(*j.indices(self.matrix.cols))]
+        return self.matrix.data[self._index(j)]
+
+    def __setitem__(self, j, value):
+        """
+        Sets the element in column j of the row.
+        Input: j (int - column index), value (float).
+        Output: None.
+        """
+        if self.matrix._shared: # the buffer is shared with a transpose view or a point, copy it before writing
+            self.matrix._make_contiguous()
+        self.matrix.data[self._index(j)] = value
+        self.matrix._version += 1
+
+    def __iter__(self):
+        matrix = self.matrix
+        start, step = self.i * matrix._row_stride, matrix._col_stride
+        data = matrix.data
+        for k in range(start, start + matrix.cols * step, step):
+            yield data[k]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+class Matrix:
+    def __init__(self, rows=0, cols=0, from_file=None, data=None, backend=None):
+        """
+        Initializes a matrix with a specified number of rows and columns, loads data from a file, or initializes with provided data.
+        Elements are stored in one flat row-major float64 buffer (self.data); element (i, j) lives at
+        i * self._row_stride + j * self._col_stride. The buffer type and the kernels come from the backend.
+        Input: rows (int), cols (int), from_file (str - file name, optional), data (list of lists of floats, optional),
+               backend (str - 'python' or 'numpy', optional - defaults to the global backend, see set_default_backend).
+        Output: None.
+        """
+        self.backend = get_backend(backend)
+        if from_file and self._is_binary_file(from_file):
+            self._load_binary_file(from_file)
+            return
+        if from_file:
+            data = self._load_from_file(from_file)
+        if data:
+            self.rows = len(data)
+            self.cols = len(data[0])
+            for row in data:
+                if len(row) != self.cols:
+                    raise ValueError("All rows of the matrix must have the same number of columns.")
+            self.data = self.backend.from_values([x for row in data for x in row])
+        else:
+            self.rows = rows
+            self.cols = cols
+            self.data = self.backend.zeros(rows * cols)
+        self._init_state()
+
+    @classmethod
+    def _from_buffer(cls, rows, cols, buffer, backend):
+        """
+        Wraps an existing flat row-major buffer in a matrix without copying it.
+        Input: rows (int), cols (int), buffer (backend buffer of length rows * cols), backend (AbstractBackend).
+        Output: Matrix.
+        """
+        result = cls.__new__(cls)
+        result.backend = backend
+        result.rows = rows
+        result.cols = cols
+        result.data = buffer
+        result._init_state()
+        return result
+
+    def _init_state(self):
+        """
+        Initializes the layout and the bookkeeping of a freshly created matrix.
+        Input: None.
+        Output: None.
+        """
+        self._row_stride = self.cols
+        self._col_stride = 1
+        self.num_switches = 0
+        self.permutation = None
+        self.decomposition = None # 'lu' or 'lup' once the matrix has been decomposed in place
+        self._version = 0 # incremented on every modification, invalidates cached factorizations
+        self._factorizations = {}
+        self._shared = False # True once the buffer is shared with a transpose view or a point (copied on the next write)
+
+    def _modified(self):
+        """
+        Marks the matrix as modified, so cached factorizations of the old values are no longer used.
+        Input: None.
+        Output: None.
+        """
+        self._version += 1
+
+    def _is_contiguous(self):
+        """
+        Checks if the matrix buffer is laid out densely in row-major order.
+        Input: None.
+        Output: bool.
+        """
+        return self._col_stride == 1 and self._row_stride == self.cols and len(self.data) == self.rows * self.cols
+
+    def _flat(self):
+        """
+        Returns the elements as a dense row-major buffer (the buffer itself if it is already dense, otherwise a packed copy).
+        Input: None.
+        Output: backend buffer of length rows * cols.
+        """
+        if self._is_contiguous():
+            return self.data
+        return self.backend.pack(self.data, self.rows, self.cols, self._row_stride, self._col_stride)
+
+    def _make_contiguous(self):
+        """
+        Repacks the matrix into its own dense row-major buffer (needed before in-place algorithms).
+        A buffer shared with a transpose view is copied, so writes never show through the other matrix.
+        Input: None.
+        Output: None.
+        """
+        if not self._is_contiguous():
+            self.data = self._flat()
+            self._row_stride = self.cols
+            self._col_stride = 1
+        elif self._shared:
+            self.data = self.backend.copy(self.data)
+        self._shared = False
+
+    def _row_list(self, i):
+        """
+        Returns a copy of row i as a list of floats.
+        Input: i (int - row index).
+        Output: list of floats.
+        """
+        start = i * self._row_stride
+        if self._col_stride == 1:
+            return self.data[start:start + self.cols].tolist()
+        return self.data[start:start + self.cols * self._col_stride:self._col_stride].tolist()
+
+    def copy(self):
+        """
+        Returns a copy of the matrix with its own buffer.
+        Input: None.
+        Output: Matrix.
+        """
+        buffer = self.backend.copy(self.data) if self._is_contiguous() else self._flat()
+        return Matrix._from_buffer(self.rows, self.cols, buffer, self.backend)
+
+    def to_backend(self, backend):
+        """
+        Returns a copy of the matrix stored and computed with another backend.
+        Input: backend (str - 'python' or 'numpy').
+        Output: Matrix.
+        """
+        backend = get_backend(backend)
+        return Matrix._from_buffer(self.rows, self.cols, backend.from_values(self._flat()), backend)
+
+    def _operand(self, other):
+        """
+        Returns the dense buffer of another matrix in this matrix's backend.
+        Input: other (Matrix).
+        Output: backend buffer.
+        """
+        return self.backend.coerce(other._flat())
+
+    def add_row(self, new_row):
+        """
+        Adds a new row to the matrix.
+        Input: new_row (list of floats).
+        Output: None.
+        """
+        if len(new_row) != self.cols:
+            raise ValueError("The new row must have the same number of columns as the matrix.")
+        self._make_contiguous()
+        self.data = self.backend.extend(self.data, new_row)
+        self.rows += 1
+        self._modified()
+
+    def to_point(self):
+        """
+        Converts the matrix to a point if it has one column. The point shares the buffer of a pure Python matrix
+        instead of copying it (O(1)); whichever of the two is written first copies the buffer.
+        Output: Point.
+        """
+        from .point import Point
+        if self.cols != 1:
+            raise ValueError("Matrix must have exactly one column to convert to a Point.")
+        buffer = self._flat()
+        if not isinstance(buffer, array): # NumPy buffer, points hold Python sequences
+            return Point(buffer.tolist())
+        point = Point(buffer)
+        if buffer is self.data:
+            self._shared = point._shared = True
+        return point
+
+    @property
+    def __array_interface__(self):
+        """
+        Exposes the buffer to NumPy (np.asarray(matrix)) without copying it, with the matrix's strides, so transpose
+        views stay views. NumPy sees the elements as of the export; the matrix copies its buffer on its next write.
+        Input: None.
+        Output: dict (NumPy array interface, version 3).
+        """
+        self._shared = True
+        itemsize = self.data.itemsize
+        return {
+            'version': 3,
+            'shape': (self.rows, self.cols),
+            'typestr': ('<' if sys.byteorder == 'little' else '>') + 'f8',
+            'data': self.data,
+            'strides': (self._row_stride * itemsize, self._col_stride * itemsize),
+        }
+
+    def _load_from_file(self, file_name):
+        """
+        Loads matrix data from a file.
+        Input: file_name (str).
+        Output: matrix (list of lists of floats).
+        """
+        with open(file_name, 'r') as f:
+            matrix = [list(map(float, line.split())) for line in f]
+        return matrix
+
+    @staticmethod
+    def _is_binary_file(file_name):
+        """
+        Checks if a file is in the binary matrix format (by its magic bytes).
+        Input: file_name (str).
+        Output: bool.
+        """
+        with open(file_name, 'rb') as f:
+            return f.read(len(MATRIX_FILE_MAGIC)) == MATRIX_FILE_MAGIC
+
+    def _load_binary_file(self, file_name):
+        """
+        Loads a matrix saved with save_to_file(..., binary=True). The backend memory-maps the data instead of parsing it.
+        Input: file_name (str).
+        Output: None.
+        """
+        with open(file_name, 'rb') as f:
+            header = f.read(MATRIX_FILE_HEADER_SIZE)
+        _, dtype, layout, self.rows, self.cols = MATRIX_FILE_HEADER.unpack_from(header)
+        dtype, layout = dtype.decode(), layout.decode()
+        if dtype not in ('f8', 'f4') or layout not in ('C', 'F'):
+            raise ValueError(f"Unsupported binary matrix file (dtype {dtype}, layout {layout}).")
+        self.data = self.backend.load_binary(file_name, MATRIX_FILE_HEADER_SIZE, self.rows * self.cols, dtype)
+        self._init_state()
+        if layout == 'F': # column-major data is used as it is, through the strides
+            self._row_stride, self._col_stride = 1, self.rows
+
+    def save_to_file(self, file_name, binary=False, dtype='f8'):
+        """
+        Saves matrix data to a file, either as text (one row per line) or in the binary format read back by Matrix(from_file=...).
+        Input: file_name (str), binary (bool), dtype (str - 'f8' or 'f4', element type of the binary format).
+        Output: None.
+        """
+        if binary:
+            if dtype not in ('f8', 'f4'):
+                raise ValueError(f"Unsupported dtype '{dtype}'.")
+            header = MATRIX_FILE_HEADER.pack(MATRIX_FILE_MAGIC, dtype.encode(), b'C', self.rows, self.cols)
+            with open(file_name, 'wb') as f:
+                f.write(header.ljust(MATRIX_FILE_HEADER_SIZE, b'\x00'))
+                self.backend.write_binary(f, self._flat(), dtype)
+            return
+        with open(file_name, 'w') as f:
+            for i in range(self.rows): # written row by row, the whole text is never built in memory
+                if i:
+                    f.write('\n')
+                f.write(' '.join(map(str, self._row_list(i))))
+
+    def __str__(self):
+        """
+        Returns a string representation of the matrix.
+        Input: None.
+        Output: A string showing matrix rows.
+        """
+        return '\n'.join(' '.join(map(str, self._row_list(i))) for i in range(self.rows))
+
+    def _position(self, i, j):
+        """
+        Returns the buffer position of element (i, j); negative indices count from the end, as for lists.
+        Input: i (int - row index), j (int - column index).
+        Output: int.
+        """
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("Row index out of range.")
+        if j < 0:
+            j += self.cols
+        if not 0 <= j < self.cols:
+            raise IndexError("Column index out of range.")
+        return i * self._row_stride + j * self._col_stride
+
+    def __getitem__(self, idx):
+        """
+        Returns the row at the specified index, or a single element for an (i, j) index.
+        Input: idx (int - row index, or tuple (int, int) - element index).
+        Output: A row view supporting [j] indexing (or a float).
+        """
+        if isinstance(idx, tuple):
+            return self.data[self._position(*idx)]
+        if idx < 0:
+            idx += self.rows
+        if not 0 <= idx < self.rows:
+            raise IndexError("Row index out of range.")
+        return _MatrixRow(self, idx)
+
+    def __setitem__(self, idx, value):
+        """
+        Sets the row at the specified index to the given values, or a single element for an (i, j) index.
+        Input: idx (int - row index, or tuple (int, int) - element index), value (list of floats, or float).
+        Output: None.
+        """
+        if isinstance(idx, tuple):
+            position = self._position(*idx)
+            if self._shared: # the buffer is shared with a transpose view or a point, copy it before writing
+                self._make_contiguous()
+                position = self._position(*idx) # the strides of the repacked buffer
+            self.data[position] = value
+            self._modified()
+            return
+        if len(value) != self.cols:
+            raise ValueError("The row must have the same number of columns as the matrix.")
+        row = self[idx]
+        for j in range(self.cols):
+            row[j] = value[j]
+
+    def __eq__(self, other):
+        """
+        Checks if two matrices are equal.
+        Input: other (Matrix).
+        Output: True if matrices are equal, False otherwise.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            return False
+        return self.backend.equal(self._flat(), other._flat())
+
+    def _term(self):
+        """
+        Returns the matrix as a leaf of a lazy elementwise expression: its dense buffer, marked as shared so that
+        writing to this matrix before the expression is evaluated copies the buffer first.
+        Input: None.
+        Output: backend buffer.
+        """
+        buffer = self._flat()
+        if buffer is self.data:
+            self._shared = True
+        return buffer
+
+    def _other_term(self, other):
+        """
+        Returns another matrix as an expression leaf (converted to this matrix's backend if needed).
+        Input: other (Matrix).
+        Output: Expression or backend buffer.
+        """
+        return other._term() if other.backend is self.backend else self._operand(other)
+
+    def _fused(self):
+        """
+        Checks if elementwise operators on this matrix build lazy expressions: the backend must evaluate whole
+        expressions in one loop, and the matrix must be large enough for that to beat a temporary per operator.
+        Input: None.
+        Output: bool.
+        """
+        return self.backend.fuses_expressions and self.rows * self.cols >= FUSE_MIN_SIZE
+
+    def _kernel(self, op, buffer, other):
+        """
+        Applies an elementwise operator right away with the backend kernels.
+        Input: op (str - '+', '-', '*' or '/'), buffer (backend buffer), other (Matrix or scalar).
+        Output: backend buffer.
+        """
+        if op == '+':
+            return self.backend.add(buffer, self._operand(other))
+        if op == '-':
+            return self.backend.sub(buffer, self._operand(other))
+        if op == '*':
+            return self.backend.scale(buffer, other)
+        return self.backend.divide(buffer, other)
+
+    def _elementwise(self, op, other):
+        """
+        Elementwise operator: returns a lazy matrix, evaluated in one fused loop when its elements are first needed,
+        or for small matrices the result computed right away.
+        Input: op (str - '+', '-', '*' or '/'), other (Matrix or scalar).
+        Output: Matrix.
+        """
+        if not self._fused():
+            return Matrix._from_buffer(self.rows, self.cols, self._kernel(op, self._flat(), other), self.backend)
+        right = self._other_term(other) if isinstance(other, Matrix) else other
+        return _LazyMatrix._from_expression(self.rows, self.cols, Expression(op, self._term(), right), self.backend)
+
+    def _assign(self, op, other):
+        """
+        In-place elementwise operator: evaluates (self op other) straight into this matrix's buffer
+        (in one fused loop, together with other's pending expression if it has one).
+        Input: op (str - '+', '-', '*' or '/'), other (Matrix or scalar).
+        Output: self.
+        """
+        self._make_contiguous()
+        if self._fused():
+            right = self._other_term(other) if isinstance(other, Matrix) else other
+            self.backend.evaluate(Expression(op, self.data, right), out=self.data)
+            self._shared = False # the expression is gone, nothing else refers to the buffer
+        else:
+            self.data[:] = self._kernel(op, self.data, other)
+        self._modified()
+        return self
+
+    def __add__(self, other):
+        """
+        Adds two matrices of the same dimensions.
+        Input: other (Matrix).
+        Output: A new matrix representing the sum.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            self.__raise_dimensions_error(other, "addition")
+
+        return self._elementwise('+', other)
+
+    def __iadd__(self, other):
+        """
+        In-place addition of two matrices.
+        Input: other (Matrix).
+        Output: Updated matrix after addition.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            self.__raise_dimensions_error(other, "addition")
+
+        return self._assign('+', other)
+
+    def __sub__(self, other):
+        """
+        Subtracts another matrix from this matrix.
+        Input: other (Matrix).
+        Output: A new matrix representing the difference.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            self.__raise_dimensions_error(other, "subtraction")
+
+        return self._elementwise('-', other)
+
+    def __isub__(self, other):
+        """
+        In-place subtraction of another matrix.
+        Input: other (Matrix).
+        Output: Updated matrix after subtraction.
+        """
+        if self.rows != other.rows or self.cols != other.cols:
+            self.__raise_dimensions_error(other, "subtraction")
+
+        return self._assign('-', other)
+
+    def __truediv__(self, scalar):
+        """
+        Divides each element of the matrix by a scalar.
+        Input: scalar (float).
+        Output: A new matrix after division.
+        """
+        if scalar == 0:
+            raise ValueError("Can't divide by zero.")
+        return self._elementwise('/', scalar)
+
+    def __itruediv__(self, scalar):
+        """
+        In-place division of each matrix element by a scalar.
+        Input: scalar (float).
+        Output: Updated matrix after division.
+        """
+        if scalar == 0:
+            raise ValueError("Can't divide by zero.")
+        return self._assign('/', scalar)
+
+    def __rttuediv__(self, scalar):
+        """
+        Divides each element of the matrix by a scalar (reverse).
+        Input: scalar (float).
+        Output: A new matrix after division.
+        """
+        return self.__truediv__(scalar)
+
+    def __mul__(self, scalar):
+        """
+        Multiplies each element of the matrix by a scalar.
+        Input: scalar (float).
+        Output: A new matrix after multiplication.
+        """
+        return self._elementwise('*', scalar)
+
+    def __rmul__(self, scalar):
+        """
+        Multiplies each element of the matrix by a scalar (reverse).
+        Input: scalar (float).
+        Output: A new matrix after multiplication.
+        """
+        return self.__mul__(scalar)
+
+    def __imul__(self, scalar):
+        """
+        In-place multiplication of each matrix element by a scalar.
+        Input: scalar (float).
+        Output: Updated matrix after multiplication.
+        """
+        return self._assign('*', scalar)
+
+    def __matmul__(self, other):
+        """
+        Multiplies this matrix by another matrix (matrix multiplication), or by a point taken as an n x 1 vector.
+        Input: other (Matrix or Point).
+        Output: A new matrix after multiplication (a Point for a point operand).
+        """
+        if _is_point(other): # the conversions share the buffers, nothing is copied
+            return (self @ other.to_matrix()).to_point()
+        if not isinstance(other, Matrix): # e.g. a sparse matrix, which handles dense @ sparse itself
+            return NotImplemented
+        if self.cols != other.rows:
+            self.__raise_dimensions_error(other, "matrix multiplication")
+
+        if other._is_transposed() and other.backend is self.backend: # A @ ~B walks the rows of B, no packing needed
+            result = self.backend.matmul_transposed(self._flat(), other.data, self.rows, self.cols, other.cols)
+        else:
+            result = self.backend.matmul(self._flat(), self._operand(other), self.rows, self.cols, other.cols)
+        return Matrix._from_buffer(self.rows, other.cols, result, self.backend)
+
+    def __imatmul__(self, other):
+        """
+        In-place multiplication of matrix by another matrix (matrix multiplication).
+        Input: other (Matrix).
+        Output: A new matrix after multiplication.
+        """
+        result = self @ other
+        self.data = result.data
+        self.rows, self.cols = result.rows, result.cols
+        self._row_stride, self._col_stride = result._row_stride, result._col_stride
+        self._shared = False
+        self._modified()
+        return self
+
+    def __invert__(self):
+        """
+        Returns the transpose of the matrix as a view: it shares this matrix's buffer with swapped strides, so nothing
+        is copied. The first write to either matrix copies the buffer, so they still behave as independent matrices.
+        Input: None.
+        Output: A new matrix that is the transpose.
+        """
+        result = Matrix._from_buffer(self.cols, self.rows, self.data, self.backend)
+        result._row_stride, result._col_stride = self._col_stride, self._row_stride
+        self._shared = result._shared = True
+        return result
+
+    def _is_transposed(self):
+        """
+        Checks if the matrix is the transpose view of a dense row-major buffer (or a column-major matrix).
+        Input: None.
+        Output: bool.
+        """
+        return self._row_stride == 1 and self._col_stride == self.rows and len(self.data) == self.rows * self.cols
+
+    def normal_equations(self, b):
+        """
+        Computes A^T A and A^T b (the normal equations of the least squares problem Ax = b) in one fused kernel,
+        without forming the transpose. A^T A is symmetric, so only its upper half is computed and then mirrored.
+        Input: b (Matrix - right-hand side, rows x m, or Point - right-hand side vector).
+        Output: A^T A (Matrix - cols x cols), A^T b (Matrix - cols x m, or Point for a point b).
+        """
+        if _is_point(b):
+            gram, rhs = self.normal_equations(b.to_matrix())
+            return gram, rhs.to_point()
+        if self.rows != b.rows:
+            self.__raise_dimensions_error(b, "normal equations")
+        gram, rhs = self.backend.normal_equations(self._flat(), self._operand(b), self.rows, self.cols, b.cols)
+        return Matrix._from_buffer(self.cols, self.cols, gram, self.backend), Matrix._from_buffer(self.cols, b.cols, rhs, self.backend)
+
+    def LU_decomposition(self, epsilon=1e-8):
+        """
+        Performs LU decomposition of the matrix.
+        Input: epsilon (float - tolerance for zero).
+        Output: None (modifies the matrix in place).
+        """
+        self.num_switches = 0 # LU doesn't require row switches
+        self.permutation = None
+        self._make_contiguous()
+        self._modified()
+        self.backend.lu(self.data, self.rows, epsilon)
+        self.decomposition = 'lu'
+
+
+    def LUP_decomposition(self, epsilon=1e-8):
+        """
+        Performs LUP decomposition of the matrix with pivoting.
+        Input: epsilon (float - tolerance for zero).
+        Output: None (modifies the matrix in place, stores the row permutation as a vector of row indices).
+        """
+        self._make_contiguous()
+        self._modified()
+        self.permutation, self.num_switches = self.backend.lup(self.data, self.rows, epsilon)
+        self.decomposition = 'lup'
+
+    def factorize(self, method='lup', epsilon=1e-8, precision='double'):
+        """
+        Returns an LU, LUP or (for symmetric matrices) Cholesky factorization of the matrix without modifying it.
+        The factorization is cached on the matrix and reused until the matrix is modified, so repeated solves,
+        determinants and inverses only pay for substitutions.
+        Input: method (str - 'lu', 'lup', 'cholesky' or 'modified_cholesky'), epsilon (float - tolerance for zero),
+               precision (str - 'double', or 'mixed' for single precision factors refined to double precision accuracy).
+        Output: LUFactorization.
+        """
+        key = (method, epsilon, precision)
+        cached = self._factorizations.get(key)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        factorization = LUFactorization(self, method, epsilon, precision)
+        self._factorizations[key] = (self._version, factorization)
+        return factorization
+
+    def forward_supstitution(self, b):
+        """
+        Solves a lower triangular system using forward substitution.
+        Input: b (Matrix - right-hand side).
+        Output: Updated right-hand side vector after forward substitution.
+        """
+        if self.cols != b.rows:
+            self.__raise_dimensions_error(b, "forward substitution")
+
+        if self.permutation is not None: # apply the row permutation, O(n) instead of multiplying by P
+            b_rows = self.backend.permute_rows(self._operand(b), self.permutation, b.cols)
+            b = Matrix._from_buffer(b.rows, b.cols, b_rows, self.backend)
+        elif b.backend is not self.backend:
+            b = b.to_backend(self.backend)
+
+        b._make_contiguous()
+        self.backend.forward_substitution(self.data, b.data, b.rows, b.cols)
+        return b
+
+    def backward_supstitution(self, b, epsilon=1e-8):
+        """
+        Solves an upper triangular system using backward substitution.
+        Input: b (Matrix - right-hand side), epsilon (float - tolerance for zero).
+        Output: Updated right-hand side vector after backward substitution.
+        """
+        if self.cols != b.rows:
+            self.__raise_dimensions_error(b, "backward substitution")
+        if b.backend is not self.backend:
+            b = b.to_backend(self.backend)
+
+        b._make_contiguous()
+        self.backend.backward_substitution(self.data, b.data, b.rows, b.cols, epsilon)
+        return b
+
+    def solve(self, b, epsilon=1e-8, method=None, precision=None):
+        """
+        Solves the linear system Ax = b using LUP decomposition; b can have several columns (AX = B).
+        If the matrix was decomposed in place (LU_decomposition or LUP_decomposition) its factors are used directly,
+        and asking for another method or for mixed precision is an error; otherwise the cached factorization from
+        factorize() is used and the matrix stays unchanged.
+        Symmetric systems can use method='cholesky', or method='modified_cholesky' which always returns the solution
+        of a positive definite system (a descent direction when A is a Hessian and b a gradient).
+        precision='mixed' factorizes in single precision and refines the solution to double precision accuracy.
+        Input: b (Matrix - right-hand side, or Point - right-hand side vector), epsilon (float - tolerance for zero),
+               method (str - see factorize, 'lup' by default), precision (str - see factorize, 'double' by default).
+        Output: Solution vector x (Matrix, or Point for a point b).
+        """
+        if _is_point(b):
+            return self.solve(b.to_matrix(), epsilon, method, precision).to_point()
+        if self.decomposition is None:
+            return self.factorize(method or 'lup', epsilon, precision or 'double').solve(b)
+        if method not in (None, self.decomposition) or precision not in (None, 'double'):
+            raise ValueError(f"The matrix holds its {self.decomposition.upper()} decomposition, it can't be solved with "
+                             f"method={method!r} and precision={precision!r}.")
+        y = self.forward_supstitution(b)
+        x = self.backward_supstitution(y, epsilon)
+        return x
+
+    def get_inverse(self, epsilon=1e-8):
+        """
+        Computes the inverse of the matrix.
+        Input: epsilon (float - tolerance for zero).
+        Output: The inverse of the matrix (Matrix).
+        """
+        if self.rows != self.cols:
+            raise ValueError("Matrix is not square.")
+
+        return self.factorize('lup', epsilon).inverse()
+
+    def get_determinant(self):
+        """
+        Computes the determinant of the matrix using LUP decomposition.
+        Input: None.
+        Output: Determinant of the matrix (float).
+        """
+        return self.factorize('lup').determinant()
+
+    def slogdet(self, method='lup', epsilon=1e-8):
+        """
+        Computes the sign and the logarithm of the absolute determinant from the cached factorization, so a following
+        solve with the same method (or get_determinant) doesn't factorize the matrix again.
+        Symmetric positive definite matrices can use method='cholesky' (half the work of LUP).
+        Input: method (str - see factorize), epsilon (float - tolerance for zero).
+        Output: sign (float - 1., -1. or 0.), log|det| (float - natural logarithm, -inf for a singular matrix).
+        """
+        return self.factorize(method, epsilon).slogdet()
+
+    def __raise_dimensions_error(self, other, operation):
+        """
+        Raises an error if matrix dimensions do not match for a specific operation.
+        Input: other (Matrix), operation (str - operation name).
+        Output: None (raises an error).
+        """
+        raise ValueError(f"""Matrices dimensions do not allow {operation}.
+Matrix 1 dimensions: {self.rows} x {self.cols}
+Matrix 2 dimensions: {other.rows} x {other.cols}""")
+
+class _LazyMatrix(Matrix):
+    """
+    Matrix whose elements are a pending elementwise expression (the result of +, -, * or / on matrices).
+    Further elementwise operators extend the expression instead of evaluating it, so B * n / n or A * 2 + B runs as
+    one loop into one buffer, which happens the first time the data is needed. A lazy matrix used in several
+    expressions is computed once for each of them.
+    """
+    @classmethod
+    def _from_expression(cls, rows, cols, expression, backend):
+        """
+        Wraps an expression in a lazy matrix.
+        Input: rows (int), cols (int), expression (Expression), backend (AbstractBackend).
+        Output: _LazyMatrix.
+        """
+        result = cls._from_buffer(rows, cols, None, backend)
+        result.expression = expression
+        return result
+
+    @property
+    def data(self):
+        if self.expression is not None:
+            self._data = self.backend.evaluate(self.expression)
+            self.expression = None
+        return self._data
+
+    @data.setter
+    def data(self, buffer):
+        self._data = buffer
+        self.expression = None
+
+    def _term(self):
+        if self.expression is not None and self.expression.depth < MAX_EXPRESSION_DEPTH:
+            return self.expression
+        return super()._term()
+
+class LUFactorization:
+    """
+    LU or LUP factorization of a square matrix, stored apart from the matrix so it can be reused for many right-hand sides.
+    Cholesky factorizations of symmetric matrices are stored as L D L^T in the same LU form (U = D @ L^T).
+    """
+    def __init__(self, matrix, method='lup', epsilon=1e-8, precision='double'):
+        """
+        Factorizes a copy of the matrix.
+        'cholesky' fails if the matrix is not positive definite, 'modified_cholesky' factorizes a nearby positive
+        definite matrix instead (self.modified tells if it had to). Only the lower triangle of the matrix is read by both.
+        With precision='mixed' the factors are kept in single precision (half the memory) and every solve is refined
+        back to double precision accuracy with residuals of the original matrix. LU and LUP rows are equilibrated
+        (scaled by powers of two) first, so badly scaled rows don't trip the epsilon pivot check.
+        Input: matrix (Matrix), method (str - 'lu', 'lup', 'cholesky' or 'modified_cholesky'), epsilon (float - tolerance for zero),
+               precision (str - 'double' or 'mixed').
+        Output: None.
+        """
+        if matrix.rows != matrix.cols:
+            raise ValueError("Matrix is not square.")
+        if precision not in ('double', 'mixed'):
+            raise ValueError(f"Unknown factorization precision '{precision}'.")
+        self.backend = matrix.backend
+        self.n = matrix.rows
+        self.method = method
+        self.epsilon = epsilon
+        self.precision = precision
+        self.row_scales = None
+        self._double = None # double precision fallback of a mixed precision factorization
+        if precision == 'mixed':
+            self.a = self.backend.copy(matrix._flat()) # the residuals are computed with the double precision original
+            a = self.a
+            if method in ('lu', 'lup'):
+                self.row_scales = [2.**-math.frexp(max(map(abs, matrix._row_list(i))))[1] for i in range(self.n)]
+                a = self.backend.scale_rows(a, self.row_scales, self.n)
+            self.norm = max(sum(map(abs, a[i * self.n:(i + 1) * self.n])) for i in range(self.n)) # of the scaled matrix
+            self.lu = self.backend.single(a)
+        else:
+            self.lu = self.backend.copy(matrix._flat()) # L below the diagonal (unit diagonal implied), U on and above it
+        self.modified = False
+        if method in ('cholesky', 'modified_cholesky'):
+            self.modified = self.backend.ldl(self.lu, self.n, epsilon, method == 'modified_cholesky')
+            self.permutation, self.num_switches = None, 0
+        elif method == 'lu':
+            self.backend.lu(self.lu, self.n, epsilon)
+            self.permutation, self.num_switches = None, 0
+        elif method == 'lup':
+            self.permutation, self.num_switches = self.backend.lup(self.lu, self.n, epsilon)
+        else:
+            raise ValueError(f"Unknown factorization method '{method}'.")
+
+    def _substitute(self, b, m):
+        """
+        Solves with the stored factors (row scaling, permutation, forward and backward substitution).
+        Input: b (flat buffer - n x m right-hand side, left unchanged), m (int - number of columns).
+        Output: Flat buffer - n x m solution.
+        """
+        if self.row_scales is not None:
+            b = self.backend.scale_rows(b, self.row_scales, m)
+        if self.permutation is not None:
+            y = self.backend.permute_rows(b, self.permutation, m)
+        else:
+            y = self.backend.copy(b)
+        self.backend.forward_substitution(self.lu, y, self.n, m)
+        self.backend.backward_substitution(self.lu, y, self.n, m, self.epsilon)
+        return y
+
+    def solve(self, b):
+        """
+        Solves Ax = b with forward and backward substitution; b is left unchanged.
+        b can have several columns, which are all solved in the same pass.
+        A mixed precision factorization refines the solution with x += A^-1 (b - Ax), the residual computed in
+        double precision, until the corrections stop changing x.
+        Input: b (Matrix - right-hand side, n x k, or Point).
+        Output: Solution vector x (Matrix, or Point for a point b).
+        """
+        if _is_point(b):
+            return self.solve(b.to_matrix()).to_point()
+        if b.rows != self.n:
+            raise ValueError(f"Right-hand side has {b.rows} rows, expected {self.n}.")
+        b_flat = self.backend.coerce(b._flat())
+        x = self._substitute(b_flat, b.cols)
+        if self.precision == 'mixed':
+            x = self._refine(b_flat, x, b.cols)
+        return Matrix._from_buffer(self.n, b.cols, x, self.backend)
+
+    def _refine(self, b, x, m):
+        """
+        Iterative refinement of a solution obtained with the single precision factors. It stops once the residual is
+        at double precision rounding level (|S(b - Ax)| <= n * eps * |SA| * |x|, infinity norms, S the row scaling).
+        If the corrections stop shrinking before that, the matrix is too ill-conditioned for single precision and
+        the system is solved again with a double precision factorization.
+        Input: b (flat buffer - n x m right-hand side), x (flat buffer - n x m solution), m (int - number of columns).
+        Output: Flat buffer - n x m refined solution.
+        """
+        tolerance = self.n * sys.float_info.epsilon * self.norm
+        last_correction = float('inf')
+        for _ in range(MAX_REFINEMENT_SWEEPS):
+            residual = self.backend.sub(b, self.backend.matmul(self.a, x, self.n, self.n, m))
+            scaled = residual if self.row_scales is None else self.backend.scale_rows(residual, self.row_scales, m)
+            if max(map(abs, scaled), default=0.) <= tolerance * max(map(abs, x), default=0.):
+                return x
+            correction = self._substitute(residual, m)
+            x = self.backend.add(x, correction)
+            size = max(map(abs, correction), default=0.)
+            if size >= last_correction / 2: # not converging (fast enough)
+                break
+            last_correction = size
+        if self.row_scales is not None: # the fallback solves the same equilibrated system
+            b = self.backend.scale_rows(b, self.row_scales, m)
+        if self._double is None:
+            a = self.a if self.row_scales is None else self.backend.scale_rows(self.a, self.row_scales, self.n)
+            self._double = LUFactorization(Matrix._from_buffer(self.n, self.n, a, self.backend), self.method, self.epsilon)
+        return self._double._substitute(b, m)
+
+    def _pivots(self):
+        """
+        Returns the diagonal of U as mantissas and exponents of two (undoing the row scaling, if any), so products
+        of many pivots can be formed without overflow or underflow.
+        Input: None.
+        Output: list of (mantissa (float), exponent (int)) pairs.
+        """
+        pivots = [math.frexp(float(self.lu[i * self.n + i])) for i in range(self.n)]
+        if self.row_scales is not None: # the scales are powers of two, 2^-k = frexp (0.5, 1 - k)
+            pivots = [(m, e - math.frexp(scale)[1] + 1) for (m, e), scale in zip(pivots, self.row_scales)]
+        return pivots
+
+    def slogdet(self):
+        """
+        Computes the sign and the natural logarithm of the absolute value of the determinant. Unlike the determinant
+        itself this never overflows or underflows, e.g. for log-likelihoods of large or badly scaled matrices.
+        For 'modified_cholesky' these are the values of the modified (positive definite) matrix.
+        Input: None.
+        Output: sign (float - 1., -1. or 0. for a singular matrix), log|det| (float - -inf for a singular matrix).
+        """
+        sign = 1. if self.num_switches % 2 == 0 else -1.
+        log_det = 0.
+        for mantissa, exponent in self._pivots():
+            if mantissa == 0:
+                return 0., -math.inf
+            if mantissa < 0:
+                sign = -sign
+            log_det += math.log(abs(mantissa)) + exponent * math.log(2)
+        return sign, log_det
+
+    def determinant(self):
+        """
+        Computes the determinant as the signed product of the diagonal of U (undoing the row scaling, if any).
+        Mantissas and exponents are multiplied separately, so only a determinant that is itself out of the float
+        range overflows (to +-inf) or underflows (to 0), not the intermediate products.
+        The determinant of a mixed precision factorization only has single precision accuracy.
+        Input: None.
+        Output: Determinant of the matrix (float).
+        """
+        det, exponent = (1. if self.num_switches % 2 == 0 else -1.), 0
+        for m, e in self._pivots():
+            det, shift = math.frexp(det * m)
+            exponent += e + shift
+        try:
+            return math.ldexp(det, exponent)
+        except OverflowError:
+            return math.copysign(math.inf, det)
+
+    def inverse(self):
+        """
+        Computes the inverse of the factorized matrix by solving for all columns of the identity in one pass.
+        Input: None.
+        Output: The inverse of the matrix (Matrix).
+        """
+        identity = Matrix(self.n, self.n, backend=self.backend)
+        for i in range(self.n):
+            identity[i, i] = 1.
+        return self.solve(identity)
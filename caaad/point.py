@@ -0,0 +1,262 @@
+from array import array
+import math
+from operator import add, mul, sub
+import sys
+
+from .expression import Expression, FUSE_MIN_SIZE, MAX_EXPRESSION_DEPTH
+
+class Point:
+    # no instance dictionary: a point is three slots, direct search methods create millions of them
+    __slots__ = ('coordinates', 'dim', '_shared')
+
+    def __init__(self, coordinates):
+        self.coordinates = coordinates
+        self.dim = len(coordinates)
+        self._shared = False # True while a lazy expression, a matrix or NumPy refers to the coordinates (copied on the next write)
+
+    def _buffer(self):
+        # the coordinates as an array('d'), which matrices and NumPy can share (list coordinates are converted once)
+        if not isinstance(self.coordinates, array):
+            self.coordinates = array('d', self.coordinates)
+        return self.coordinates
+
+    def to_matrix(self):
+        # n x 1 matrix sharing the coordinates (O(1)), whichever of the two is written first copies them
+        from .backends import get_backend
+        from .matrix import Matrix
+        backend = get_backend()
+        if backend is not get_backend('python'): # NumPy matrices have their own buffers
+            return Matrix._from_buffer(self.dim, 1, backend.from_values(self.coordinates), backend)
+        matrix = Matrix._from_buffer(self.dim, 1, self._buffer(), backend)
+        matrix._shared = self._shared = True
+        return matrix
+
+    @property
+    def __array_interface__(self):
+        # exposes the coordinates to NumPy (np.asarray(point)) without copying them
+        buffer = self._buffer()
+        self._shared = True
+        return {'version': 3, 'shape': (self.dim,), 'typestr': ('<' if sys.byteorder == 'little' else '>') + 'f8', 'data': buffer}
+
+    def _term(self):
+        # the point as a leaf of a lazy elementwise expression
+        self._shared = True
+        return self.coordinates
+
+    def _own(self):
+        # copies shared coordinates (see _shared) before writing to them
+        if self._shared:
+            self.coordinates = self.coordinates[:]
+            self._shared = False
+
+    def _store(self, values):
+        # result of an in-place operator: written into the coordinate list, or into a new list if the old
+        # coordinates are shared or an array('d')
+        if self._shared or type(self.coordinates) is not list:
+            self.coordinates = list(values)
+            self._shared = False
+        else:
+            self.coordinates[:] = values
+        return self
+
+    def _lazy(self, op, other, reverse=False):
+        # elementwise operator on a large point: a lazy point, evaluated in one fused loop when it is needed
+        left, right = self._term(), other._term() if isinstance(other, Point) else other
+        return _LazyPoint(Expression(op, right, left) if reverse else Expression(op, left, right), self.dim)
+
+    def _assign(self, op, other):
+        # in-place operator on a large point, evaluated in one fused loop that writes into the coordinates
+        right = other._term() if isinstance(other, Point) else other
+        if self._shared:
+            self._own()
+        if type(self.coordinates) is tuple:
+            self.coordinates = list(self.coordinates)
+        Expression(op, self.coordinates, right).evaluate(self.coordinates)
+        return self
+
+    # Point +- Point maps the C-level operator over both coordinate lists (no per-element bytecode)
+    def __add__(self, other):
+        if isinstance(other, Point):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('+', other)
+            return Point(list(map(add, self.coordinates, other.coordinates)))
+        elif isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('+', other)
+            return Point([a + other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for addition")
+
+    __radd__ = __add__
+
+    def __iadd__(self, other):
+        if isinstance(other, Point):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('+', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] += other.coordinates[i]
+        elif isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('+', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] += other
+        else:
+            raise TypeError("Unsupported type for in-place addition")
+        return self
+
+    def __sub__(self, other):
+        if isinstance(other, Point):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('-', other)
+            return Point(list(map(sub, self.coordinates, other.coordinates)))
+        elif isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('-', other)
+            return Point([a - other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for subtraction")
+
+    def __rsub__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('-', other, reverse=True)
+            return Point([other - a for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for reverse subtraction")
+
+    def __isub__(self, other):
+        if isinstance(other, Point):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('-', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] -= other.coordinates[i]
+        elif isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('-', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] -= other
+        else:
+            raise TypeError("Unsupported type for in-place subtraction")
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('*', other)
+            return Point([a * other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for multiplication")
+
+    __rmul__ = __mul__
+
+    def __imul__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('*', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] *= other
+        else:
+            raise TypeError("Unsupported type for in-place multiplication")
+        return self
+
+    def __truediv__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('/', other)
+            return Point([a / other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for division")
+
+    def __rtruediv__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('/', other, reverse=True)
+            return Point([other / a for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for reverse division")
+
+    def __itruediv__(self, other):
+        if isinstance(other, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._assign('/', other)
+            if self._shared:
+                self._own()
+            for i in range(self.dim):
+                self.coordinates[i] /= other
+        else:
+            raise TypeError("Unsupported type for in-place division")
+        return self
+
+    def __pow__(self, power):
+        if isinstance(power, (int, float)):
+            if self.dim >= FUSE_MIN_SIZE:
+                return self._lazy('**', power)
+            return Point([a ** power for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for power")
+
+    def __getitem__(self, index):
+        return self.coordinates[index]
+
+    def __setitem__(self, index, value):
+        self._own()
+        self.coordinates[index] = value
+
+    def copy(self):
+        return Point(self.coordinates[:])
+
+    def __repr__(self):
+        return f"Point({list(self.coordinates)})"
+    
+    # BLAS level 1 operations, so vector updates in the optimizers need no temporary points
+    def dot(self, other):
+        return sum(map(mul, self.coordinates, other.coordinates))
+
+    def axpy(self, alpha, x):
+        # self += alpha * x in place, in one pass
+        if self.dim >= FUSE_MIN_SIZE:
+            return self._assign('+', Expression('*', alpha, x._term()))
+        return self._store([a + alpha * b for a, b in zip(self.coordinates, x.coordinates)])
+
+    def norm(self):
+        return math.sqrt(self.dot(self))
+
+    euclidean_norm = norm
+
+# point whose coordinates are a pending elementwise expression, e.g. (1 + alpha) * xc - alpha * x_h of large points;
+# operators on it extend the expression, which is evaluated in one loop when the coordinates are first needed
+class _LazyPoint(Point):
+    __slots__ = ('_coordinates', 'expression')
+
+    def __init__(self, expression, dim):
+        self._coordinates = None
+        self.expression = expression
+        self.dim = dim
+        self._shared = False
+
+    @property
+    def coordinates(self):
+        if self.expression is not None:
+            self._coordinates = self.expression.evaluate()
+            self.expression = None
+        return self._coordinates
+
+    @coordinates.setter
+    def coordinates(self, coordinates):
+        self._coordinates = coordinates
+        self.expression = None
+
+    def _term(self):
+        if self.expression is not None and self.expression.depth < MAX_EXPRESSION_DEPTH:
+            return self.expression
+        return super()._term()
\ No newline at end of file
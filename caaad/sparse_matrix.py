@@ -0,0 +1,313 @@
+from array import array
+from operator import mul
+
+from .matrix import Matrix, _is_point
+
+class CSRMatrix:
+    """
+    Sparse matrix in compressed sparse row format: the nonzeros of row i are values[row_pointers[i]:row_pointers[i+1]],
+    in the columns col_indices[row_pointers[i]:row_pointers[i+1]] (sorted).
+    """
+    def __init__(self, rows, cols, values=None, col_indices=None, row_pointers=None):
+        """
+        Initializes a sparse matrix from its CSR arrays (an empty matrix if they are omitted).
+        Input: rows (int), cols (int), values (iterable of floats), col_indices (iterable of ints), row_pointers (iterable of ints).
+        Output: None.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.values = array('d', values or [])
+        self.col_indices = array('q', col_indices or [])
+        self.row_pointers = array('q', row_pointers or [0] * (rows + 1))
+        if len(self.row_pointers) != rows + 1 or len(self.values) != len(self.col_indices):
+            raise ValueError("Invalid CSR arrays.")
+        self._symmetric = None
+
+    @classmethod
+    def from_triplets(cls, rows, cols, triplets):
+        """
+        Builds a sparse matrix from (row, column, value) triplets; values at the same position are summed.
+        Input: rows (int), cols (int), triplets (iterable of (int, int, float)).
+        Output: CSRMatrix.
+        """
+        entries = {}
+        for i, j, value in triplets:
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise IndexError(f"Triplet ({i}, {j}) is outside a {rows} x {cols} matrix.")
+            entries[i, j] = entries.get((i, j), 0.) + value
+        values, col_indices, row_pointers = [], [], [0] * (rows + 1)
+        for (i, j) in sorted(entries):
+            if entries[i, j] != 0:
+                values.append(entries[i, j])
+                col_indices.append(j)
+                row_pointers[i + 1] += 1
+        for i in range(rows):
+            row_pointers[i + 1] += row_pointers[i]
+        return cls(rows, cols, values, col_indices, row_pointers)
+
+    @classmethod
+    def from_dense(cls, matrix, tolerance=0.):
+        """
+        Converts a dense matrix, keeping the elements whose absolute value is larger than the tolerance.
+        Input: matrix (Matrix), tolerance (float).
+        Output: CSRMatrix.
+        """
+        values, col_indices, row_pointers = [], [], [0]
+        for i in range(matrix.rows):
+            for j, value in enumerate(matrix._row_list(i)):
+                if abs(value) > tolerance:
+                    values.append(value)
+                    col_indices.append(j)
+            row_pointers.append(len(values))
+        return cls(matrix.rows, matrix.cols, values, col_indices, row_pointers)
+
+    def to_dense(self, backend=None):
+        """
+        Converts the sparse matrix to a dense Matrix.
+        Input: backend (str - backend of the result, optional).
+        Output: Matrix.
+        """
+        result = Matrix(self.rows, self.cols, backend=backend)
+        data, cols = result.data, self.cols
+        for i in range(self.rows):
+            for k in range(self.row_pointers[i], self.row_pointers[i + 1]):
+                data[i * cols + self.col_indices[k]] = self.values[k]
+        return result
+
+    @property
+    def nnz(self):
+        """
+        Number of stored nonzero elements.
+        """
+        return len(self.values)
+
+    def __repr__(self):
+        return f"CSRMatrix({self.rows} x {self.cols}, nnz={self.nnz})"
+
+    def __str__(self):
+        return str(self.to_dense())
+
+    def __invert__(self):
+        """
+        Returns the transpose of the matrix (a counting sort of the nonzeros by column).
+        Input: None.
+        Output: CSRMatrix.
+        """
+        row_pointers = [0] * (self.cols + 1)
+        for j in self.col_indices:
+            row_pointers[j + 1] += 1
+        for j in range(self.cols):
+            row_pointers[j + 1] += row_pointers[j]
+        next_position = row_pointers[:-1]
+        values, col_indices = [0.] * self.nnz, [0] * self.nnz
+        for i in range(self.rows):
+            for k in range(self.row_pointers[i], self.row_pointers[i + 1]):
+                j = self.col_indices[k]
+                position = next_position[j]
+                values[position], col_indices[position] = self.values[k], i
+                next_position[j] += 1
+        return CSRMatrix(self.cols, self.rows, values, col_indices, row_pointers)
+
+    def _row(self, i):
+        """
+        Returns the nonzeros of row i.
+        Input: i (int - row index).
+        Output: values (array('d')), col_indices (array('q')).
+        """
+        start, end = self.row_pointers[i], self.row_pointers[i + 1]
+        return self.values[start:end], self.col_indices[start:end]
+
+    def _matvec(self, x):
+        """
+        Multiplies the matrix by a dense vector.
+        Input: x (list of floats - length cols).
+        Output: list of floats - length rows.
+        """
+        result = []
+        for i in range(self.rows):
+            values, col_indices = self._row(i)
+            result.append(sum(map(mul, values, [x[j] for j in col_indices])))
+        return result
+
+    def __matmul__(self, other):
+        """
+        Multiplies this sparse matrix by a dense Matrix, a Point or another CSRMatrix.
+        Input: other (Matrix, Point or CSRMatrix).
+        Output: Matrix, Point or CSRMatrix (same kind as other).
+        """
+        from .point import Point
+        if isinstance(other, Point):
+            if other.dim != self.cols:
+                raise ValueError(f"Can't multiply a {self.rows} x {self.cols} matrix by a point of dimension {other.dim}.")
+            return Point(self._matvec(list(other.coordinates)))
+        if other.rows != self.cols:
+            raise ValueError(f"""Matrices dimensions do not allow matrix multiplication.
+Matrix 1 dimensions: {self.rows} x {self.cols}
+Matrix 2 dimensions: {other.rows} x {other.cols}""")
+        if isinstance(other, CSRMatrix):
+            return self._matmul_sparse(other)
+        m = other.cols
+        b_rows = [other._row_list(j) for j in range(other.rows)]
+        result = other.backend.zeros(self.rows * m)
+        for i in range(self.rows):
+            acc = [0.] * m
+            for value, j in zip(*self._row(i)):
+                acc = [a + value * b for a, b in zip(acc, b_rows[j])]
+            result[i * m:(i + 1) * m] = other.backend.from_values(acc)
+        return Matrix._from_buffer(self.rows, m, result, other.backend)
+
+    def __rmatmul__(self, other):
+        """
+        Multiplies a dense Matrix by this sparse matrix, as (~self @ ~other) transposed.
+        Input: other (Matrix).
+        Output: Matrix.
+        """
+        return ~((~self) @ (~other))
+
+    def _matmul_sparse(self, other):
+        """
+        Sparse times sparse product, accumulating one output row at a time (Gustavson's algorithm).
+        Input: other (CSRMatrix).
+        Output: CSRMatrix.
+        """
+        values, col_indices, row_pointers = [], [], [0]
+        for i in range(self.rows):
+            acc = {}
+            for value, k in zip(*self._row(i)):
+                for other_value, j in zip(*other._row(k)):
+                    acc[j] = acc.get(j, 0.) + value * other_value
+            for j in sorted(acc):
+                values.append(acc[j])
+                col_indices.append(j)
+            row_pointers.append(len(values))
+        return CSRMatrix(self.rows, other.cols, values, col_indices, row_pointers)
+
+    def normal_equations(self, b):
+        """
+        Computes A^T A (sparse) and A^T b (dense) for the least squares problem Ax = b, like Matrix.normal_equations.
+        Input: b (Matrix - right-hand side, rows x m, or Point).
+        Output: A^T A (CSRMatrix), A^T b (Matrix, or Point for a point b).
+        """
+        transpose = ~self
+        return transpose @ self, transpose @ b
+
+    def is_symmetric(self):
+        """
+        Checks (once, the result is cached) if the matrix equals its transpose.
+        Input: None.
+        Output: bool.
+        """
+        if self._symmetric is None:
+            transpose = ~self
+            self._symmetric = self.rows == self.cols and transpose.col_indices == self.col_indices \
+                and transpose.row_pointers == self.row_pointers and transpose.values == self.values
+        return self._symmetric
+
+    def solve(self, b, epsilon=1e-8, method=None, max_iter=None):
+        """
+        Solves Ax = b iteratively, using only products with A (the matrix is never densified or factorized).
+        Symmetric matrices use conjugate gradients; BiCGSTAB is used for nonsymmetric matrices and as a fallback
+        when conjugate gradients find the matrix is not positive definite.
+        method='cholesky' and method='modified_cholesky' keep the guarantees of the dense methods (see Matrix.solve)
+        with conjugate gradients only: 'cholesky' raises an error if the matrix is not positive definite, and
+        'modified_cholesky' then solves (A + tau I) x = b instead, doubling the shift tau until conjugate gradients
+        find no direction of nonpositive curvature. Started from 0, conjugate gradients on a positive definite system
+        return an x with b^T x > 0 after any number of steps, so the solution is a descent direction when A is a
+        Hessian and b a gradient.
+        Input: b (Matrix - right-hand side, n x 1, or Point), epsilon (float - relative residual tolerance),
+               method (str - None, 'lu' or 'lup' solve iteratively, 'cholesky' or 'modified_cholesky' see above),
+               max_iter (int, optional).
+        Output: Solution vector x (Matrix, or Point for a point b).
+        """
+        if _is_point(b):
+            return self.solve(b.to_matrix(), epsilon, method, max_iter).to_point()
+        if self.rows != self.cols:
+            raise ValueError("Matrix is not square.")
+        if b.rows != self.rows or b.cols != 1:
+            raise ValueError(f"Right-hand side must be a {self.rows} x 1 matrix.")
+        cholesky = method in ('cholesky', 'modified_cholesky')
+        if cholesky and not self.is_symmetric():
+            raise ValueError("Matrix is not symmetric.")
+        max_iter = max_iter or 10 * self.rows
+        rhs = b._flat().tolist()
+        x = None
+        if self.is_symmetric():
+            x = self._conjugate_gradient(rhs, epsilon, max_iter)
+        if x is None and method == 'modified_cholesky':
+            # the first shift is small relative to the largest element, so nearly positive definite systems change little
+            shift = max(epsilon, 1e-3 * max(map(abs, self.values), default=0.))
+            while x is None:
+                x = self._conjugate_gradient(rhs, epsilon, max_iter, shift)
+                shift *= 2
+        if x is None:
+            if cholesky:
+                raise ValueError("Matrix is not positive definite.")
+            x = self._bicgstab(rhs, epsilon, max_iter)
+        return Matrix._from_buffer(self.rows, 1, b.backend.from_values(x), b.backend)
+
+    def _conjugate_gradient(self, b, epsilon, max_iter, shift=0.):
+        """
+        Conjugate gradient method for symmetric positive definite systems (A + shift I) x = b.
+        Input: b (list of floats), epsilon (float - relative residual tolerance), max_iter (int),
+               shift (float - added to the diagonal, 0 by default).
+        Output: Solution (list of floats), or None if the matrix turned out not to be positive definite.
+        """
+        x = [0.] * self.rows
+        r, p = b[:], b[:]
+        rr = sum(map(mul, r, r))
+        tolerance = epsilon**2 * rr
+        for _ in range(max_iter):
+            if rr <= tolerance:
+                break
+            Ap = self._matvec(p)
+            if shift:
+                Ap = [api + shift * pi for api, pi in zip(Ap, p)]
+            pAp = sum(map(mul, p, Ap))
+            if pAp <= 0:
+                return None
+            alpha = rr / pAp
+            x = [xi + alpha * pi for xi, pi in zip(x, p)]
+            r = [ri - alpha * api for ri, api in zip(r, Ap)]
+            rr_new = sum(map(mul, r, r))
+            p = [ri + rr_new / rr * pi for ri, pi in zip(r, p)]
+            rr = rr_new
+        return x
+
+    def _bicgstab(self, b, epsilon, max_iter):
+        """
+        Stabilized biconjugate gradient method for general nonsingular systems.
+        Input: b (list of floats), epsilon (float - relative residual tolerance), max_iter (int).
+        Output: Solution (list of floats).
+        """
+        n = self.rows
+        x = [0.] * n
+        r = b[:]
+        r_hat = r[:]
+        rho = alpha = omega = 1.
+        v, p = [0.] * n, [0.] * n
+        tolerance = epsilon**2 * sum(map(mul, b, b))
+        for _ in range(max_iter):
+            if sum(map(mul, r, r)) <= tolerance:
+                return x
+            rho_new = sum(map(mul, r_hat, r))
+            if rho_new == 0:
+                break
+            beta = rho_new / rho * alpha / omega
+            p = [ri + beta * (pi - omega * vi) for ri, pi, vi in zip(r, p, v)]
+            v = self._matvec(p)
+            r_hat_v = sum(map(mul, r_hat, v))
+            if r_hat_v == 0:
+                raise ValueError("Iterative solver broke down (the matrix may be singular).")
+            alpha = rho_new / r_hat_v
+            s = [ri - alpha * vi for ri, vi in zip(r, v)]
+            t = self._matvec(s)
+            tt = sum(map(mul, t, t))
+            omega = sum(map(mul, t, s)) / tt if tt else 0.
+            x = [xi + alpha * pi + omega * si for xi, pi, si in zip(x, p, s)]
+            r = [si - omega * ti for si, ti in zip(s, t)]
+            rho = rho_new
+            if omega == 0:
+                break
+        if sum(map(mul, r, r)) > tolerance:
+            raise ValueError("Iterative solver did not converge (the matrix may be singular).")
+        return x
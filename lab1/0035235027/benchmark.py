@@ -0,0 +1,323 @@
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from array import array
+
+import caaad
+from caaad import backends
+from caaad.batched_matrix import BatchedMatrix
+from caaad.matrix import Matrix
+from caaad.point import Point
+
+def random_matrix(rows, cols):
+    """
+    Creates a matrix with uniformly distributed random elements.
+    Input: rows (int), cols (int).
+    Output: Matrix.
+    """
+    return Matrix(data=[[random.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)])
+
+def measure(function, repeat=3):
+    """
+    Measures the best wall-clock time of several calls of a function.
+    Input: function (callable without arguments), repeat (int - number of calls).
+    Output: Best time in milliseconds (float).
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def naive_matmul(a, b, n, k, m):
+    """
+    Reference cell-by-cell multiplication (the original Matrix.__matmul__ loop).
+    Input: a (array('d') - n x k), b (array('d') - k x m), n, k, m (int - dimensions).
+    Output: array('d') - n x m product.
+    """
+    result = array('d', bytes(8 * n * m))
+    for i in range(n):
+        for j in range(m):
+            result[i * m + j] = sum(a[i * k + p] * b[p * m + j] for p in range(k))
+    return result
+
+class DictPoint:
+    """
+    Reference point with the original representation and operators (instance dictionary, list comprehensions).
+    """
+    def __init__(self, coordinates):
+        self.coordinates = coordinates
+        self.dim = len(coordinates)
+
+    def __add__(self, other):
+        if isinstance(other, DictPoint):
+            return DictPoint([a + b for a, b in zip(self.coordinates, other.coordinates)])
+        elif isinstance(other, (int, float)):
+            return DictPoint([a + other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for addition")
+
+    def __sub__(self, other):
+        if isinstance(other, DictPoint):
+            return DictPoint([a - b for a, b in zip(self.coordinates, other.coordinates)])
+        elif isinstance(other, (int, float)):
+            return DictPoint([a - other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for subtraction")
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return DictPoint([a * other for a in self.coordinates])
+        else:
+            raise TypeError("Unsupported type for multiplication")
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __iadd__(self, other):
+        if isinstance(other, DictPoint):
+            for i in range(self.dim):
+                self.coordinates[i] += other.coordinates[i]
+        elif isinstance(other, (int, float)):
+            for i in range(self.dim):
+                self.coordinates[i] += other
+        else:
+            raise TypeError("Unsupported type for in-place addition")
+        return self
+
+def lup_solve(A, b):
+    """
+    Solves Ax = b the way lab1 does it, with an in-place LUP decomposition followed by substitutions.
+    Input: A (Matrix), b (Matrix).
+    Output: Solution vector x (Matrix).
+    """
+    A.LUP_decomposition()
+    return A.solve(b)
+
+def benchmark_matmul(sizes=(2, 3, 4, 8, 16, 32, 64, 128, 160, 192, 256)):
+    """
+    Times every pure Python matrix multiplication kernel on square matrices, to show where the dispatch thresholds in backends.py come from.
+    Input: sizes (tuple of ints - matrix sizes).
+    Output: Prints a table of times in milliseconds and the kernel picked by Matrix.__matmul__.
+    """
+    kernels = [naive_matmul, backends._matmul_small, backends._matmul_packed, backends._matmul_blocked]
+    print(f"{'n':>5}" + ''.join(f"{kernel.__name__:>16}" for kernel in kernels) + f"{'dispatch':>16}")
+    for n in sizes:
+        a, b = random_matrix(n, n).data, random_matrix(n, n).data
+        times = [measure(lambda: kernel(a, b, n, n, n), repeat=1 if n >= 128 else 3) for kernel in kernels]
+        dispatch = backends._matmul_small if n <= backends.MATMUL_SMALL_SIZE else \
+            backends._matmul_blocked if n >= backends.MATMUL_BLOCKED_SIZE else backends._matmul_packed
+        print(f"{n:>5}" + ''.join(f"{t:>16.3f}" for t in times) + f"{dispatch.__name__:>16}")
+
+def benchmark_backends(sizes=(3, 10, 50, 100, 200)):
+    """
+    Compares the pure Python and the NumPy backend on the operations used by the labs.
+    Input: sizes (tuple of ints - matrix sizes).
+    Output: Prints a table of times in milliseconds for each operation and backend.
+    """
+    names = ['python'] + (['numpy'] if backends._load_numpy() else [])
+    operations = {
+        'A @ B': lambda A, B, b: A @ B,
+        '~A': lambda A, B, b: ~A,
+        'A + B': lambda A, B, b: A + B,
+        'LUP + solve': lambda A, B, b: lup_solve(A.copy(), b.copy()),
+        'inverse': lambda A, B, b: A.copy().get_inverse(),
+        'determinant': lambda A, B, b: A.copy().get_determinant(),
+    }
+    print(f"{'operation':>12}{'n':>6}" + ''.join(f"{name:>12}" for name in names))
+    for operation, function in operations.items():
+        for n in sizes:
+            A, B, b = random_matrix(n, n), random_matrix(n, n), random_matrix(n, 1)
+            times = []
+            for name in names:
+                A_, B_, b_ = A.to_backend(name), B.to_backend(name), b.to_backend(name)
+                times.append(measure(lambda: function(A_, B_, b_), repeat=1 if n >= 200 else 3))
+            print(f"{operation:>12}{n:>6}" + ''.join(f"{t:>12.3f}" for t in times))
+
+def benchmark_lu(sizes=(50, 100, 200, 500, 1000, 2000), time_limit=30.):
+    """
+    Compares the classic (unblocked) LUP with the blocked right-looking LUP for growing matrix sizes.
+    A variant is skipped for the remaining sizes once one of its runs takes longer than time_limit seconds.
+    Input: sizes (tuple of ints - matrix sizes), time_limit (float - seconds).
+    Output: Prints a table of times in milliseconds ('-' for skipped runs).
+    """
+    variants = [('python', 'unblocked'), ('python', 'blocked')]
+    if backends._load_numpy():
+        variants += [('numpy', 'unblocked'), ('numpy', 'blocked')]
+    skipped = set()
+    print(f"{'n':>6}" + ''.join(f"{name + ' ' + kind:>20}" for name, kind in variants))
+    for n in sizes:
+        A = random_matrix(n, n)
+        line = f"{n:>6}"
+        for variant in variants:
+            if variant in skipped:
+                line += f"{'-':>20}"
+                continue
+            backend = backends.get_backend(variant[0])
+            a = backend.from_values(A.data)
+            block = n if variant[1] == 'unblocked' else backends.LU_BLOCK_SIZE
+            t = measure(lambda: backend._lu_blocked(backend.copy(a), n, 1e-8, list(range(n)), block), repeat=1)
+            if t > time_limit * 1000:
+                skipped.add(variant)
+            line += f"{t:>20.1f}"
+        print(line)
+
+def benchmark_parallel(sizes=(200, 400), workers=(1, 2, 4, 8, 16, 32)):
+    """
+    Times the parallel mode of the pure Python backend (set_parallel) for growing worker counts.
+    Worker counts above the number of cores are skipped.
+    Input: sizes (tuple of ints - matrix sizes), workers (tuple of ints - process counts).
+    Output: Prints a table of times in milliseconds.
+    """
+    workers = [w for w in workers if w <= (os.cpu_count() or 1)]
+    operations = {
+        'A @ B': lambda A, B: A @ B,
+        'A + B': lambda A, B: A + B,
+        'LUP': lambda A, B: A.factorize('lup'),
+    }
+    print(f"{'operation':>12}{'n':>6}" + ''.join(f"{str(w) + ' workers':>14}" for w in workers))
+    for operation, function in operations.items():
+        for n in sizes:
+            A, B = random_matrix(n, n), random_matrix(n, n)
+            times = []
+            for w in workers:
+                backends.set_parallel(w)
+                function(A.copy(), B) # starts the worker processes
+                times.append(measure(lambda: function(A.copy(), B), repeat=1))
+            print(f"{operation:>12}{n:>6}" + ''.join(f"{t:>14.1f}" for t in times))
+    backends.set_parallel(1)
+
+def benchmark_batched(counts=(100, 1000, 10000), sizes=(2, 3)):
+    """
+    Compares solving many small systems one Matrix at a time with one BatchedMatrix solve.
+    Input: counts (tuple of ints - numbers of systems), sizes (tuple of ints - system sizes).
+    Output: Prints a table of times in milliseconds.
+    """
+    print(f"{'n':>3}{'count':>8}{'Matrix.solve':>16}{'BatchedMatrix':>16}{'speedup':>10}")
+    for n in sizes:
+        for count in counts:
+            data = [random.uniform(-1, 1) for _ in range(count * n * n)]
+            rhs = [random.uniform(-1, 1) for _ in range(count * n)]
+            matrices = [Matrix(data=[data[k * n * n + i * n:k * n * n + (i + 1) * n] for i in range(n)]) for k in range(count)]
+            vectors = [Matrix(data=[[v] for v in rhs[k * n:(k + 1) * n]]) for k in range(count)]
+            t_single = measure(lambda: [matrix.copy().solve(vector) for matrix, vector in zip(matrices, vectors)], repeat=1)
+            t_batched = measure(lambda: BatchedMatrix(count, n, data).solve(rhs))
+            print(f"{n:>3}{count:>8}{t_single:>16.2f}{t_batched:>16.2f}{t_single / t_batched:>10.1f}")
+
+def benchmark_strassen(sizes=(256, 384, 512, 768), leaf_sizes=(128, 256), samples=64):
+    """
+    Compares the classic pure Python multiplication with Strassen-Winograd (set_strassen) for several leaf sizes.
+    The error is measured on randomly sampled elements against exactly rounded dot products (math.fsum),
+    relative to the size of the operands: max |C_ij - fl(C_ij)| / (|A| |B|), max-element norms.
+    Input: sizes (tuple of ints - matrix sizes), leaf_sizes (tuple of ints), samples (int - checked elements per product).
+    Output: Prints a table of times in milliseconds and relative errors.
+    """
+    print(f"{'n':>5}{'classic ms':>14}{'error':>10}" + ''.join(f"{'leaf ' + str(leaf) + ' ms':>16}{'error':>10}" for leaf in leaf_sizes))
+    for n in sizes:
+        a, b = random_matrix(n, n).data, random_matrix(n, n).data
+        scale = max(map(abs, a)) * max(map(abs, b))
+        entries = [(random.randrange(n), random.randrange(n)) for _ in range(samples)]
+        exact = [math.fsum(a[i * n + p] * b[p * n + j] for p in range(n)) for i, j in entries]
+        error = lambda c: max(abs(c[i * n + j] - x) for (i, j), x in zip(entries, exact)) / scale
+        line = ""
+        for leaf in (None,) + tuple(leaf_sizes):
+            kernel = lambda: backends._matmul_strassen(a, b, n, leaf) if leaf else backends._matmul_serial(a, b, n, n, n)
+            c = kernel()
+            line += f"{measure(kernel, repeat=1):>{14 if leaf is None else 16}.0f}{error(c):>10.1e}"
+        print(f"{n:>5}" + line)
+
+def benchmark_point(dims=(2, 3, 10, 100), count=100000):
+    """
+    Compares the memory and the arithmetic latency of Point with the original representation (DictPoint).
+    Memory is measured with tracemalloc over count points created by additions and includes the coordinates.
+    Input: dims (tuple of ints - point dimensions), count (int - points per measurement).
+    Output: Prints a table of bytes per point and microseconds per operation.
+    """
+    operations = {
+        'X + Y': lambda X, Y: X + Y,
+        'X - Y': lambda X, Y: X - Y,
+        'a * X': lambda X, Y: 1.5 * X,
+        'X += Y': lambda X, Y: X.__iadd__(Y),
+    }
+    print(f"{'dim':>4}{'class':>11}{'bytes':>8}" + ''.join(f"{name + ' us':>12}" for name in operations))
+    for dim in dims:
+        for cls in (DictPoint, Point):
+            X, Y = cls([random.uniform(-1, 1) for _ in range(dim)]), cls([random.uniform(-1, 1) for _ in range(dim)])
+            tracemalloc.start()
+            points = [X + Y for _ in range(count)]
+            size = tracemalloc.get_traced_memory()[0] / count
+            tracemalloc.stop()
+            del points
+            times = [measure(lambda: [function(X, Y) for _ in range(count)], repeat=5) * 1000 / count for function in operations.values()]
+            print(f"{dim:>4}{cls.__name__:>11}{size:>8.0f}" + ''.join(f"{t:>12.3f}" for t in times))
+
+def benchmark_import(repeat=20):
+    """
+    Measures the cold start of a short-lived worker process: a new interpreter that imports part of the package and
+    exits. The first row is the interpreter alone, the other rows include it.
+    Input: repeat (int - processes started per statement, the median is reported).
+    Output: Prints a table of times in milliseconds.
+    """
+    statements = {
+        'interpreter': "pass",
+        'import caaad': "import caaad",
+        'direct search': "from caaad import hooke_jeeves, nelder_mead",
+        'gradient methods': "from caaad import gradient_descent",
+        'Matrix': "from caaad import Matrix",
+        'NumPy backend': "from caaad import get_backend; get_backend('numpy')",
+    }
+    package_path = os.path.dirname(os.path.dirname(caaad.__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [package_path, os.environ.get('PYTHONPATH')])))
+    env.pop('MATRIX_BACKEND', None)
+    print(f"{'imports':>18}{'ms':>10}{'over interpreter':>18}")
+    base = None
+    for name, statement in statements.items():
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', statement], env=env, check=True)
+            times.append((time.perf_counter() - start) * 1000)
+        t = statistics.median(times)
+        base = t if base is None else base
+        print(f"{name:>18}{t:>10.1f}{t - base:>18.1f}")
+
+def __main__():
+    """
+    Runs all benchmarks.
+    Input: None.
+    Output: Prints the benchmark tables.
+    """
+    random.seed(0)
+    print("MATRIX MULTIPLICATION (ms):")
+    benchmark_matmul()
+    print("------------------------------------------------")
+    print("BACKENDS (ms):")
+    benchmark_backends()
+    print("------------------------------------------------")
+    print("LUP DECOMPOSITION SCALING (ms):")
+    benchmark_lu()
+    print("------------------------------------------------")
+    print("PARALLEL MODE (ms):")
+    benchmark_parallel()
+    print("------------------------------------------------")
+    print("BATCHED SMALL SYSTEMS (ms):")
+    benchmark_batched()
+    print("------------------------------------------------")
+    print("STRASSEN-WINOGRAD (ms, relative error):")
+    benchmark_strassen()
+    print("------------------------------------------------")
+    print("POINT REPRESENTATION (bytes per point, microseconds per operation):")
+    benchmark_point()
+    print("------------------------------------------------")
+    print("IMPORT TIME OF A WORKER PROCESS (ms):")
+    benchmark_import()
+    print("------------------------------------------------")
+
+if __name__ == "__main__":
+    __main__()
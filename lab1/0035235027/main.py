@@ -1,4 +1,4 @@
-from matrix import Matrix
+from caaad.matrix import Matrix
 
 def compare_matrices(directory):
     """
@@ -41,18 +41,13 @@ def solve_system_of_linear_equations(directory, epsilon=1e-8):
     print("")
 
     try:
-        A.LU_decomposition(epsilon)
-        x = A.solve(b, epsilon=epsilon)
+        x = A.factorize('lu', epsilon).solve(b) # A and b stay unchanged, so LUP can reuse them
         print("LU solution for x:\n", x)
     except ValueError as e:
         print(f"An error occurred in LU decomposition solution for x: {e}")
 
-    A = Matrix(from_file=directory+'A.txt')
-    b = Matrix(from_file=directory+'b.txt')
-    
     try:
-        A.LUP_decomposition(epsilon)
-        x = A.solve(b, epsilon=epsilon)
+        x = A.factorize('lup', epsilon).solve(b)
         print("LUP solution for x:\n", x)
     except ValueError as e:
         print(f"An error occurred in LUP decomposition solution for x: {e}")
@@ -1,8 +1,8 @@
 import math
 import random
 from tabulate import tabulate
-from point import Point
-from lab2_utils import golden_section_search, coordinate_search, hooke_jeeves, nelder_mead
+from caaad.point import Point
+from caaad.lab2_utils import golden_section_search, coordinate_search, hooke_jeeves, nelder_mead
 
 def f_task1(x):
     if isinstance(x, Point):
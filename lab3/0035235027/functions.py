@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 import math
 
-from matrix import Matrix
+from caaad.matrix import Matrix
+from caaad.point import Point
 
 class AbstractFunction(ABC):
     def __init__(self):
@@ -38,14 +39,14 @@ class Function1(AbstractFunction):
 
     def gradient(self, x):
         self.num_gradient_calls += 1
-        return Matrix(data=[[-400 * x[0] * (x[1] - x[0]**2) - 2 * (1 - x[0])], [200 * (x[1] - x[0]**2)]])
+        return Point([-400 * x[0] * (x[1] - x[0]**2) - 2 * (1 - x[0]), 200 * (x[1] - x[0]**2)])
 
     def hessian(self, x):
         self.num_hessian_calls += 1
         return Matrix(data=[[1200 * x[0]**2 - 400 * x[1] + 2, -400 * x[0]], [-400 * x[0], 200]])
     
     def g(self, x):
-        return Matrix(data=[[10 * (x[1] - x[0]**2)], [1 - x[0]]])
+        return Point([10 * (x[1] - x[0]**2), 1 - x[0]])
     
     def jacobian(self, x):
         self.num_jacobian_calls += 1
@@ -58,7 +59,7 @@ class Function2(AbstractFunction):
 
     def gradient(self, x):
         self.num_gradient_calls += 1
-        return Matrix(data=[[2 * (x[0] - 4)], [8 * (x[1] - 2)]])
+        return Point([2 * (x[0] - 4), 8 * (x[1] - 2)])
 
     def hessian(self, x):
         self.num_hessian_calls += 1
@@ -71,7 +72,7 @@ class Function3(AbstractFunction):
 
     def gradient(self, x):
         self.num_gradient_calls += 1
-        return Matrix(data=[[2 * (x[0] - 2)], [2 * (x[1] + 3)]])
+        return Point([2 * (x[0] - 2), 2 * (x[1] + 3)])
 
     def hessian(self, x):
         self.num_hessian_calls += 1
@@ -84,7 +85,7 @@ class Function4(AbstractFunction):
 
     def gradient(self, x):
         self.num_gradient_calls += 1
-        return Matrix(data=[[x[0]**3 - 2 * x[0] + 2], [2 * (x[1] - 1)]])
+        return Point([x[0]**3 - 2 * x[0] + 2, 2 * (x[1] - 1)])
 
     def hessian(self, x):
         self.num_hessian_calls += 1
@@ -102,7 +103,7 @@ class Function_Task5(AbstractFunction):
         pass
 
     def g(self, x):
-        return Matrix(data=[[x[0]**2 + x[1]**2 - 1], [x[1] - x[0]**2]])
+        return Point([x[0]**2 + x[1]**2 - 1, x[1] - x[0]**2])
     
     def jacobian(self, x):
         self.num_jacobian_calls += 1
@@ -126,8 +127,8 @@ class Function_Task6(AbstractFunction):
     def g(self, x):
         residuals = []
         for t, y in self.measurements:
-            residuals.append([x[0] * math.exp(x[1] * t) + x[2] - y])
-        return Matrix(data=residuals)
+            residuals.append(x[0] * math.exp(x[1] * t) + x[2] - y)
+        return Point(residuals)
     
     def jacobian(self, x):
         self.num_jacobian_calls += 1
@@ -1,6 +1,6 @@
 from functions import *
-from lab3_utils import gradient_descent, newton_raphson, gauss_newton
-from point import Point
+from caaad.lab3_utils import gradient_descent, newton_raphson, gauss_newton
+from caaad.point import Point
 
 def print_results(starting_point, optimal_point, f, algorithm):
     print("Starting point:", starting_point)
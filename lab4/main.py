@@ -1,6 +1,6 @@
 from functions import *
-from point import Point
-from lab4_utils import box_method, transformation_method
+from caaad.point import Point
+from caaad.lab4_utils import box_method, transformation_method
 
 def print_results(f, optimal_point):
     print(f"Optimal point: {optimal_point}, Optimal value: {f(optimal_point)}")
@@ -0,0 +1,95 @@
+import math
+
+import pytest
+
+from caaad import Point, brent_search, coordinate_search, find_unimodal_interval, golden_section_search, hooke_jeeves, nelder_mead
+
+class Counted:
+    def __init__(self, f):
+        self.f = f
+        self.calls = 0
+        self.points = set() # evaluated points of several variables
+
+    def __call__(self, x):
+        self.calls += 1
+        if isinstance(x, Point):
+            self.points.add(tuple(x.coordinates))
+        return self.f(x)
+
+# functions of lab 2
+def f1(x):
+    return 100 * (x[1] - x[0]**2)**2 + (1 - x[0])**2
+
+def f2(x):
+    return (x[0] - 4)**2 + 4 * (x[1] - 2)**2
+
+def f3(x):
+    return sum((x[i] - i)**2 for i in range(x.dim))
+
+LAB_PROBLEMS = [(f1, [-1.9, 2], [1, 1]), (f2, [0.1, 0.3], [4, 2]), (f3, [0] * 5, [0, 1, 2, 3, 4])]
+
+def two_point_golden_calls(f, a, b, e=1e-6):
+    # evaluations of the classic golden section search that evaluates both inner points of [a, b] first
+    k = (5**0.5 - 1) / 2
+    c, d = b - k * (b - a), a + k * (b - a)
+    fc, fd, calls = f(c), f(d), 2
+    while b - a >= e:
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - k * (b - a)
+            fc = f(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + k * (b - a)
+            fd = f(d)
+        calls += 1
+    return calls
+
+@pytest.mark.parametrize('start_point', [-50, 0, 1.7, 10, 100, 1000])
+def test_golden_section_search_reuses_bracket_point(start_point):
+    f = Counted(lambda x: (x - 2)**2 + 1)
+    x, num_iterations = golden_section_search(f, start_point, return_num_iterations=True)
+    assert x == pytest.approx(2, abs=1e-6)
+    assert num_iterations == f.calls
+    left, right, bracket_calls = find_unimodal_interval(f, start_point, return_num_iterations=True)
+    assert num_iterations < bracket_calls + two_point_golden_calls(f, left, right)
+
+def test_golden_section_search_interval():
+    f = Counted(lambda x: math.cos(x))
+    x, num_iterations = golden_section_search(f, a=0, b=2 * math.pi, return_num_iterations=True)
+    assert x == pytest.approx(math.pi, abs=1e-6)
+    assert num_iterations == f.calls
+    assert num_iterations == two_point_golden_calls(math.cos, 0, 2 * math.pi) - 1
+
+@pytest.mark.parametrize('f, x0, minimum', LAB_PROBLEMS)
+def test_nelder_mead(f, x0, minimum):
+    f = Counted(f)
+    x, num_evaluations = nelder_mead(f, Point(x0), return_num_iterations=True)
+    assert list(x.coordinates) == pytest.approx(minimum, abs=1e-2)
+    assert num_evaluations == f.calls == len(f.points) # every point evaluated once
+
+@pytest.mark.parametrize('f, x0, minimum', LAB_PROBLEMS)
+def test_hooke_jeeves_lattice_cache(f, x0, minimum):
+    f = Counted(f)
+    x, num_evaluations, stats = hooke_jeeves(f, Point(x0), return_num_iterations=True, return_cache_stats=True)
+    assert list(x.coordinates) == pytest.approx(minimum, abs=1e-5)
+    assert num_evaluations == stats['misses'] == f.calls == len(f.points) # every lattice point evaluated once
+    assert stats['hits'] > 0 # probes that would have been evaluated again without the cache
+
+@pytest.mark.parametrize('start_point', [0, 10, 100])
+def test_brent_search(start_point):
+    f = Counted(lambda x: (x - 2)**2)
+    x, num_iterations = brent_search(f, start_point, return_num_iterations=True)
+    assert isinstance(x, float) and x == pytest.approx(2, abs=1e-6)
+    assert num_iterations == f.calls
+    assert num_iterations < golden_section_search(f, start_point, return_num_iterations=True)[1]
+    x, num_iterations = brent_search(math.cos, a=0, b=2 * math.pi, return_num_iterations=True)
+    assert x == pytest.approx(math.pi, abs=1e-6)
+
+@pytest.mark.parametrize('f, x0, minimum', LAB_PROBLEMS[1:])
+def test_coordinate_search_line_search(f, x0, minimum):
+    results = [coordinate_search(f, Point(x0), return_num_iterations=True, line_search=line_search)
+               for line_search in (golden_section_search, brent_search)]
+    for x, _ in results:
+        assert list(x.coordinates) == pytest.approx(minimum, abs=1e-5)
+    assert results[1][1] < results[0][1]
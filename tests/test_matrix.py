@@ -0,0 +1,331 @@
+from array import array
+import math
+import random
+
+import pytest
+
+from caaad import BatchedMatrix, CSRMatrix, Matrix, Point, backends, newton_raphson, set_parallel, set_strassen
+from caaad.backends import LU_BLOCK_SIZE, LU_BLOCKED_SIZE
+from caaad.matrix import MATRIX_FILE_HEADER, MATRIX_FILE_HEADER_SIZE, MATRIX_FILE_MAGIC
+
+def random_rows(rows, cols, seed=0):
+    generator = random.Random(seed)
+    return [[generator.uniform(-1, 1) for _ in range(cols)] for _ in range(rows)]
+
+def reference_matmul(a, b):
+    return [[sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))] for i in range(len(a))]
+
+def assert_close(matrix, expected, tolerance=1e-9):
+    assert (matrix.rows, matrix.cols) == (len(expected), len(expected[0]))
+    for i in range(matrix.rows):
+        for j in range(matrix.cols):
+            assert matrix[i][j] == pytest.approx(expected[i][j], rel=tolerance, abs=tolerance)
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    return request.param
+
+@pytest.mark.parametrize('n, k, m', [(1, 1, 1), (2, 2, 2), (3, 3, 3), (2, 3, 1), (5, 7, 3), (17, 33, 9), (40, 40, 40)])
+def test_matmul(backend, n, k, m):
+    a, b = random_rows(n, k, 1), random_rows(k, m, 2)
+    assert_close(Matrix(data=a, backend=backend) @ Matrix(data=b, backend=backend), reference_matmul(a, b))
+
+@pytest.mark.parametrize('n', [1, 2, 3, 10, 40])
+def test_solve(backend, n):
+    a, x = random_rows(n, n, 3), random_rows(n, 2, 4)
+    A = Matrix(data=a, backend=backend)
+    assert_close(A.solve(Matrix(data=reference_matmul(a, x), backend=backend)), x, 1e-7)
+
+@pytest.mark.parametrize('method', ['lu', 'lup'])
+@pytest.mark.parametrize('n', [LU_BLOCKED_SIZE, 2 * LU_BLOCK_SIZE + 13, 150]) # blocked LU, partial last panel
+def test_blocked_lu_solve(backend, method, n):
+    a, x = random_rows(n, n, 20), random_rows(n, 2, 21)
+    if method == 'lu': # no pivoting: make the matrix diagonally dominant
+        a = [[value + n * (i == j) for j, value in enumerate(row)] for i, row in enumerate(a)]
+    A = Matrix(data=a, backend=backend)
+    assert_close(A.solve(Matrix(data=reference_matmul(a, x), backend=backend), method=method), x, 1e-7)
+
+@pytest.mark.parametrize('n', [1, 2, 3, 10, 40])
+def test_inverse(backend, n):
+    A = Matrix(data=random_rows(n, n, 5), backend=backend)
+    identity = [[float(i == j) for j in range(n)] for i in range(n)]
+    assert_close(A @ A.get_inverse(), identity, 1e-7)
+
+def test_determinant(backend):
+    A = Matrix(data=[[2., -1., 0.], [-1., 2., -1.], [0., -1., 2.]], backend=backend)
+    assert A.get_determinant() == pytest.approx(4.)
+    P = Matrix(data=[[0., 1.], [1., 0.]], backend=backend) # one row switch
+    assert P.get_determinant() == pytest.approx(-1.)
+
+def test_singular(backend):
+    A = Matrix(data=[[1., 2.], [2., 4.]], backend=backend)
+    with pytest.raises(ValueError):
+        A.solve(Matrix(data=[[1.], [2.]], backend=backend))
+
+def test_solve_leaves_matrix_unchanged(backend):
+    a = random_rows(4, 4, 6)
+    A = Matrix(data=a, backend=backend)
+    A.solve(Matrix(data=random_rows(4, 1, 7), backend=backend))
+    assert_close(A, a, 0)
+
+def test_solve_after_in_place_decomposition(backend):
+    a, x = random_rows(4, 4, 30), random_rows(4, 1, 31)
+    b = Matrix(data=reference_matmul(a, x), backend=backend)
+    A = Matrix(data=a, backend=backend)
+    A.LUP_decomposition()
+    assert_close(A.solve(b), x, 1e-9)
+    assert_close(A.solve(b, method='lup', precision='double'), x, 1e-9)
+    for method, precision in ('lu', None), ('cholesky', None), (None, 'mixed'):
+        with pytest.raises(ValueError):
+            A.solve(b, method=method, precision=precision)
+
+def test_element_index(backend):
+    A = Matrix(data=[[float(20 * i + j) for j in range(20)] for i in range(20)], backend=backend)
+    assert A[-1, -1] == 399. and A[-20, 3] == 3. and A[2, -1] == 59.
+    assert A[-1][-1] == 399.
+    for index in (0, 20), (20, 0), (-21, 0), (0, -21):
+        with pytest.raises(IndexError):
+            A[index]
+        with pytest.raises(IndexError):
+            A[index] = 1.
+    T = ~A # the transpose shares the buffer of A
+    assert T[-1, 0] == 19.
+    with pytest.raises(IndexError):
+        T[0, 20]
+    T[-1, 0] = -1.
+    assert T[19, 0] == -1. and A[0, 19] == 19.
+
+def test_row_view_follows_repacking(backend):
+    A = Matrix(data=[[1., 2.], [3., 4.]], backend=backend)
+    T = ~A
+    row = T[0]
+    T[1, 0] = 9. # copies and repacks the shared transpose buffer
+    assert list(row) == [1., 3.]
+    assert row[1] == 3.
+    row[1] = 7.
+    assert T[0][1] == 7. and T[1][0] == 9.
+    assert A[1][0] == 3.
+
+def test_row_view_of_column_major_file(backend, tmp_path):
+    file_name = tmp_path / 'matrix.bin'
+    header = MATRIX_FILE_HEADER.pack(MATRIX_FILE_MAGIC, b'f8', b'F', 3, 2).ljust(MATRIX_FILE_HEADER_SIZE, b'\0')
+    file_name.write_bytes(header + array('d', [1., 2., 3., 4., 5., 6.]).tobytes()) # columns [1, 2, 3] and [4, 5, 6]
+    M = Matrix(from_file=str(file_name), backend=backend)
+    row = M[2]
+    assert list(row) == [3., 6.]
+    M.add_row([7., 8.]) # repacks the column-major buffer row-major
+    assert list(row) == [3., 6.]
+    row[0] = 0.
+    assert M[2][0] == 0. and M[3][1] == 8.
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5])
+def test_batched_solve(n):
+    matrices = [random_rows(n, n, seed) for seed in range(4)]
+    vectors = [[1. + i for i in range(n)] for _ in matrices]
+    batch = BatchedMatrix.from_matrices(matrices)
+    x = batch.solve([Point(vector) for vector in vectors])
+    for k, matrix in enumerate(matrices):
+        expected = Matrix(data=matrix).solve(Matrix(data=[[v] for v in vectors[k]]))
+        assert list(x[k * n:(k + 1) * n]) == pytest.approx([expected[i][0] for i in range(n)])
+    assert list(batch.solve([v for vector in vectors for v in vector])) == pytest.approx(list(x))
+
+@pytest.mark.parametrize('n', [1, 2, 3, 5])
+def test_batched_determinant_and_inverse(n):
+    matrices = [random_rows(n, n, seed) for seed in range(4)]
+    batch = BatchedMatrix.from_matrices(matrices)
+    inverse = batch.inverse()
+    for k, matrix in enumerate(matrices):
+        assert batch.determinant()[k] == pytest.approx(Matrix(data=matrix).get_determinant())
+        identity = [[float(i == j) for j in range(n)] for i in range(n)]
+        assert_close(Matrix(data=matrix) @ inverse[k], identity, 1e-7)
+
+@pytest.mark.parametrize('n', [2, 5])
+def test_batched_factors_depend_on_epsilon(n):
+    nearly_singular = [[float(i == j) * (1e-6 if i == n - 1 else 1.) for j in range(n)] for i in range(n)]
+    batch = BatchedMatrix.from_matrices([nearly_singular])
+    batch.solve([1.] * n, epsilon=1e-8)
+    with pytest.raises(ValueError):
+        batch.solve([1.] * n, epsilon=1e-4)
+
+def spd_rows(n, seed=0):
+    a = random_rows(n, n, seed)
+    return [[sum(a[k][i] * a[k][j] for k in range(n)) + n * (i == j) for j in range(n)] for i in range(n)]
+
+@pytest.mark.parametrize('method', ['cholesky', 'modified_cholesky'])
+def test_cholesky_solve(backend, method):
+    a, x = spd_rows(6, 8), random_rows(6, 1, 9)
+    b = Matrix(data=reference_matmul(a, x), backend=backend)
+    assert_close(Matrix(data=a, backend=backend).solve(b, method=method), x, 1e-7)
+    assert_close(CSRMatrix.from_dense(Matrix(data=a, backend=backend)).solve(b, method=method), x, 1e-7)
+
+def test_cholesky_indefinite(backend):
+    a = [[-2., 0.], [0., 1.]]
+    b = Matrix(data=[[1.], [1.]], backend=backend)
+    for A in Matrix(data=a, backend=backend), CSRMatrix.from_dense(Matrix(data=a, backend=backend)):
+        with pytest.raises(ValueError):
+            A.solve(b, method='cholesky')
+        x = A.solve(b, method='modified_cholesky')
+        assert x[0][0] + x[1][0] > 0 # descent direction for the gradient -b
+
+class SparseQuadratic:
+    # f(x) = sum d_i (x_i - 1)^2 + x_0^4 - 2 x_0^2 with a sparse diagonal Hessian, indefinite at x_0 = 0
+    def __init__(self, n):
+        self.d = [1. + i % 3 for i in range(n)]
+
+    def __call__(self, x):
+        return sum(d * (xi - 1)**2 for d, xi in zip(self.d, x.coordinates)) + x[0]**4 - 2 * x[0]**2
+
+    def gradient(self, x):
+        return Point([2 * d * (xi - 1) for d, xi in zip(self.d, x.coordinates)]) + Point([4 * x[0]**3 - 4 * x[0]] + [0.] * (len(self.d) - 1))
+
+    def hessian(self, x):
+        return CSRMatrix.from_triplets(len(self.d), len(self.d), [(i, i, 2 * d + (12 * x[0]**2 - 4 if i == 0 else 0.)) for i, d in enumerate(self.d)])
+
+    def f_lambda(self, x, delta_x, lambda_):
+        return self(x + lambda_ * delta_x)
+
+def test_sparse_modified_cholesky_stays_sparse(monkeypatch):
+    n = 300
+    monkeypatch.setattr(CSRMatrix, 'to_dense', None)
+    H = SparseQuadratic(n).hessian(Point([0.] * n))
+    g = Point([1.] * n)
+    x = H.solve(g, method='modified_cholesky')
+    assert x.dot(g) > 0
+    with pytest.raises(ValueError):
+        H.solve(g, method='cholesky')
+    H = SparseQuadratic(n).hessian(Point([2.] * n))
+    x = H.solve(g, method='cholesky')
+    assert list(x.coordinates) == pytest.approx([1. / H._row(i)[0][0] for i in range(n)])
+
+def test_newton_raphson_sparse_hessian(monkeypatch):
+    n = 300
+    monkeypatch.setattr(CSRMatrix, 'to_dense', None)
+    f = SparseQuadratic(n)
+    x = newton_raphson(f, Point([0.] * n))
+    assert abs(x[0]) > 0.5 # left the saddle at x_0 = 0
+    assert list(x.coordinates)[1:] == pytest.approx([1.] * (n - 1))
+
+@pytest.mark.parametrize('n', [1, 3, 10, 40])
+def test_mixed_precision_solve(backend, n):
+    a, x = random_rows(n, n, 10), random_rows(n, 2, 11)
+    A = Matrix(data=a, backend=backend)
+    assert_close(A.solve(Matrix(data=reference_matmul(a, x), backend=backend), precision='mixed'), x, 1e-9)
+    spd, b = spd_rows(n, 12), Matrix(data=random_rows(n, 1, 13), backend=backend)
+    S = Matrix(data=spd, backend=backend)
+    expected = S.solve(b, method='cholesky')
+    assert_close(S.solve(b, method='cholesky', precision='mixed'), [[expected[i][0]] for i in range(n)], 1e-9)
+
+def test_slogdet(backend):
+    P = Matrix(data=[[0., 2.], [3., 0.]], backend=backend)
+    sign, log_det = P.slogdet()
+    assert sign == -1. and log_det == pytest.approx(math.log(6.))
+    S = Matrix(data=spd_rows(5, 14), backend=backend)
+    assert S.slogdet('cholesky')[1] == pytest.approx(math.log(S.get_determinant()))
+    assert Matrix(data=[[1., 2.], [2., 4.]], backend=backend).slogdet() == (0., -math.inf)
+
+def test_determinant_without_overflow(backend):
+    n = 80
+    A = Matrix(data=[[float(i == j) * (1e10 if i < n // 2 else 1e-10) for j in range(n)] for i in range(n)], backend=backend)
+    assert A.get_determinant() == pytest.approx(1.) # the partial products leave the float range
+    B = Matrix(data=[[float(i == j) * 1e10 for j in range(n // 2)] for i in range(n // 2)], backend=backend)
+    assert B.slogdet() == pytest.approx((1., n // 2 * 10 * math.log(10)))
+    assert B.get_determinant() == math.inf
+
+@pytest.mark.parametrize('n', [5, 8, 13, 27, 45]) # the NumPy backend ignores Strassen mode
+def test_strassen_matmul(monkeypatch, n):
+    a, b = random_rows(n, n, 15), random_rows(n, n, 16)
+    calls = []
+    strassen = backends._matmul_strassen
+    monkeypatch.setattr(backends, '_matmul_strassen', lambda *args, **kwargs: calls.append(args[2]) or strassen(*args, **kwargs))
+    set_strassen(5, 4)
+    try:
+        product = Matrix(data=a, backend='python') @ Matrix(data=b, backend='python')
+    finally:
+        set_strassen(None)
+    assert calls and calls[0] == n
+    assert_close(product, reference_matmul(a, b))
+
+def test_transpose_detaches_on_write(backend):
+    a = random_rows(3, 4, 17)
+    A = Matrix(data=a, backend=backend)
+    T = ~A
+    T[0, 1] = 5.
+    assert_close(A, a, 0)
+    A[2, 3] = 6.
+    assert T[3][2] == a[2][3] and T[0][1] == 5.
+
+def test_point_matrix_detach_on_write():
+    p = Point([1., 2., 3.])
+    M = p.to_matrix()
+    M[0, 0] = 5.
+    assert list(p.coordinates) == [1., 2., 3.]
+    q = Point([float(i) for i in range(300)])
+    N = q.to_matrix()
+    q += Point([1.] * 300) # fused in-place path
+    q[1] = -1.
+    assert [N[i][0] for i in range(300)] == [float(i) for i in range(300)]
+    assert q[0] == 1. and q[1] == -1. and q[299] == 300.
+
+@pytest.mark.parametrize('rows, cols', [(2, 3), (30, 30), (70, 70)]) # 70 x 70 is more than one output block
+def test_lazy_chain(backend, rows, cols):
+    a, b = random_rows(rows, cols, 18), random_rows(rows, cols, 19)
+    A, B = Matrix(data=a, backend=backend), Matrix(data=b, backend=backend)
+    expected = [[(x * 2 + y - x / 4) * 3 - y for x, y in zip(ra, rb)] for ra, rb in zip(a, b)]
+    C = (A * 2 + B - A / 4) * 3 - B
+    assert_close(C, expected)
+    A += B * 2 - A # the right-hand side reads A while it is overwritten
+    assert_close(A, [[2 * y for y in rb] for rb in b])
+    assert_close(B, b, 0)
+
+@pytest.fixture
+def parallel():
+    set_parallel(2, min_size=8)
+    yield
+    set_parallel(1)
+
+def test_parallel_matmul(parallel):
+    a, b = random_rows(30, 20, 22), random_rows(20, 25, 23)
+    product = Matrix(data=a, backend='python') @ Matrix(data=b, backend='python')
+    assert backends._pool is not None # the product ran on the worker processes
+    assert_close(product, reference_matmul(a, b))
+    total = Matrix(data=a, backend='python') + Matrix(data=a, backend='python')
+    assert_close(total, [[2 * value for value in row] for row in a])
+
+def test_sparse_from_triplets(backend):
+    A = CSRMatrix.from_triplets(3, 4, [(2, 1, 1.), (0, 3, 2.), (2, 1, 2.), (1, 0, 1.), (1, 0, -1.)])
+    assert A.nnz == 2 # duplicates are summed, zero sums dropped
+    assert_close(A.to_dense(backend), [[0., 0., 0., 2.], [0., 0., 0., 0.], [0., 3., 0., 0.]], 0)
+    with pytest.raises(IndexError):
+        CSRMatrix.from_triplets(2, 2, [(2, 0, 1.)])
+
+def sparse_rows(rows, cols, seed):
+    generator = random.Random(seed)
+    return [[generator.uniform(-1, 1) if generator.random() < 0.3 else 0. for _ in range(cols)] for _ in range(rows)]
+
+def test_sparse_products(backend):
+    a, b, c = sparse_rows(7, 5, 24), sparse_rows(5, 6, 25), random_rows(5, 3, 26)
+    A, B = CSRMatrix.from_dense(Matrix(data=a, backend=backend)), CSRMatrix.from_dense(Matrix(data=b, backend=backend))
+    assert_close((~A).to_dense(backend), [list(column) for column in zip(*a)], 0)
+    assert_close((A @ B).to_dense(backend), reference_matmul(a, b))
+    assert_close(A @ Matrix(data=c, backend=backend), reference_matmul(a, c))
+    assert_close(Matrix(data=random_rows(3, 7, 27), backend=backend) @ A, reference_matmul(random_rows(3, 7, 27), a))
+    x = [1., -2., 0.5, 3., 0.]
+    assert list((A @ Point(x)).coordinates) == pytest.approx([row[0] for row in reference_matmul(a, [[v] for v in x])])
+
+@pytest.mark.parametrize('symmetric', [True, False]) # conjugate gradients, BiCGSTAB
+def test_sparse_solve(backend, symmetric):
+    n = 40
+    a = [[value + 4 * (i == j) for j, value in enumerate(row)] for i, row in enumerate(sparse_rows(n, n, 28))]
+    if symmetric:
+        a = [[a[i][j] + a[j][i] for j in range(n)] for i in range(n)]
+    A = CSRMatrix.from_dense(Matrix(data=a, backend=backend))
+    assert A.is_symmetric() == symmetric
+    x = random_rows(n, 1, 29)
+    assert_close(A.solve(Matrix(data=reference_matmul(a, x), backend=backend), epsilon=1e-12), x, 1e-8)
+
+def test_sparse_solve_breakdown(backend):
+    A = CSRMatrix.from_triplets(2, 2, [(0, 1, 1.), (1, 0, 1.)]) # indefinite, b is orthogonal to Ab
+    with pytest.raises(ValueError):
+        A.solve(Matrix(data=[[1.], [0.]], backend=backend))
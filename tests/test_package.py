@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def loaded_modules(code):
+    # names in sys.modules after running code in a fresh interpreter
+    environment = dict(os.environ, PYTHONPATH=ROOT)
+    environment.pop('MATRIX_BACKEND', None) # the default pure Python backend
+    output = subprocess.run([sys.executable, '-c', code + '\nimport sys\nprint(" ".join(sys.modules))'],
+                            env=environment, capture_output=True, text=True, check=True).stdout
+    return set(output.split())
+
+def test_point_does_not_import_linear_algebra():
+    modules = loaded_modules('import caaad\ncaaad.Point')
+    assert 'caaad.point' in modules
+    assert not {'caaad.matrix', 'caaad.backends', 'numpy'} & modules
+
+def test_lazy_names():
+    modules = loaded_modules('import caaad\ncaaad.Matrix\ncaaad.lab2_utils')
+    assert {'caaad.matrix', 'caaad.lab2_utils'} <= modules
+    assert 'numpy' not in modules # only the NumPy backend imports it
+
+def test_unknown_name():
+    import caaad
+    with pytest.raises(AttributeError):
+        caaad.no_such_name
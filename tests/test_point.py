@@ -0,0 +1,62 @@
+import pytest
+
+from caaad import Point, get_backend, set_default_backend
+
+@pytest.mark.parametrize('dim', [3, 300, 5000]) # 5000 is more than one output block of the fused loop
+def test_lazy_chain(dim):
+    x = Point([0.5 * i for i in range(dim)])
+    y = Point([1. - i for i in range(dim)])
+    alpha = 0.7
+    z = (1 + alpha) * x - alpha * y
+    assert list(z.coordinates) == pytest.approx([(1 + alpha) * a - alpha * b for a, b in zip(x.coordinates, y.coordinates)])
+    expected = [a + 2 * b for a, b in zip(x.coordinates, y.coordinates)]
+    x += y * 2
+    x.axpy(-1., y)
+    x -= y * -1
+    assert list(x.coordinates) == pytest.approx(expected)
+
+@pytest.fixture
+def python_backend():
+    previous = get_backend().name
+    set_default_backend('python') # NumPy matrices have their own buffers
+    yield
+    set_default_backend(previous)
+
+def test_matrix_conversions_share_buffer(python_backend):
+    p = Point([1., 2., 3.])
+    M = p.to_matrix()
+    assert M.data is p.coordinates
+    q = M.to_point()
+    assert q.coordinates is M.data
+    q[2] = 7. # the first write copies
+    assert list(p.coordinates) == [1., 2., 3.] and M[2][0] == 3.
+
+def test_numpy_shares_coordinates():
+    np = pytest.importorskip('numpy')
+    p = Point([1., 2., 3.])
+    a = np.asarray(p)
+    assert a.dtype == np.float64 and a.tolist() == [1., 2., 3.]
+    assert a.__array_interface__['data'][0] == p.coordinates.buffer_info()[0] # no copy
+    p[0] = 5. # the point copies its coordinates, the array keeps the exported values
+    assert a[0] == 1. and p[0] == 5.
+
+def test_slots():
+    p = Point([1., 2.])
+    assert not hasattr(p, '__dict__')
+    with pytest.raises(AttributeError):
+        p.label = 'start'
+    assert (p + Point([1., 1.])).coordinates == [2., 3.] and p.dim == 2
+
+@pytest.mark.parametrize('dim', [3, 300]) # plain loops, fused loop
+def test_blas_operations(dim):
+    x = Point([float(i) for i in range(dim)])
+    y = Point([1. - 0.5 * i for i in range(dim)])
+    expected_dot = sum(a * b for a, b in zip(x.coordinates, y.coordinates))
+    assert x.dot(y) == pytest.approx(expected_dot)
+    assert y.norm() == pytest.approx(y.dot(y)**0.5)
+    expected = [a - 2.5 * b for a, b in zip(x.coordinates, y.coordinates)]
+    coordinates = x.coordinates
+    assert x.axpy(-2.5, y) is x
+    assert list(x.coordinates) == pytest.approx(expected)
+    assert list(y.coordinates) == [1. - 0.5 * i for i in range(dim)]
+    assert x.coordinates is coordinates # updated in place